@@ -22,7 +22,7 @@ from typing import Mapping, MutableMapping, Union
 
 from pydantic import BaseModel, ConfigDict, StrictBool
 from sqlalchemy import MetaData, create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -31,6 +31,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.orm.decl_api import DeclarativeMeta, registry
+from sqlalchemy.pool import QueuePool
 
 from sqlalchemy_bind_manager.exceptions import (
     InvalidConfigError,
@@ -96,6 +97,12 @@ class SQLAlchemyBindManager:
         engine_options: dict = config.engine_options or {}
         engine_options.setdefault("echo", False)
         engine_options.setdefault("future", True)
+        if "poolclass" not in engine_options and self.__uses_queue_pool(config):
+            # Reuse the most recently returned connections, so that the
+            # ones exceeding the real concurrency stay idle and can be
+            # closed server side. Pre-ping discards those stale connections.
+            engine_options.setdefault("pool_use_lifo", True)
+            engine_options.setdefault("pool_pre_ping", True)
 
         session_options: dict = config.session_options or {}
         session_options.setdefault("expire_on_commit", False)
@@ -114,6 +121,15 @@ class SQLAlchemyBindManager:
                 session_options=session_options,
             )
 
+    @staticmethod
+    def __uses_queue_pool(config: SQLAlchemyConfig) -> bool:
+        url = make_url(config.engine_url)
+        dialect_class = url.get_dialect()
+        if config.async_engine:
+            # Some drivers (e.g. psycopg) provide a different dialect for async engines
+            dialect_class = dialect_class.get_async_dialect_cls(url)
+        return issubclass(dialect_class.get_pool_class(url), QueuePool)  # type: ignore
+
     def __build_sync_bind(
         self,
         engine_url: str,
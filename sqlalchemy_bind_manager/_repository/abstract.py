@@ -30,8 +30,10 @@
 from abc import ABC, abstractmethod
 from typing import (
     Any,
+    AsyncIterator,
     Generic,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -87,10 +89,26 @@ class SQLAlchemyAsyncRepositoryInterface(Generic[MODEL], ABC):
         ...
 
     @abstractmethod
-    async def delete(self, instance: MODEL) -> None:
+    async def bulk_insert(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Insert many rows in a single statement, bypassing the ORM unit of work.
+
+        ORM events (i.e. `before_insert`, `after_insert`) are not triggered
+        and no model instance is returned or tracked by the session.
+
+        :param rows: A list of mappings of column names and values
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, entity: Union[MODEL, PRIMARY_KEY]) -> None:
         """Deletes a model.
 
-        :param instance: The model instance
+        When the primary key is passed, eligible models are deleted with
+        a single DELETE statement: ORM delete events and session
+        cascades are not triggered in this case.
+
+        :param entity: The model instance or the primary key
+        :raises ModelNotFoundError: No model has been found using the primary key
         """
         ...
 
@@ -110,6 +128,7 @@ class SQLAlchemyAsyncRepositoryInterface(Generic[MODEL], ABC):
             None,
             Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
         ] = None,
+        eager: Union[None, Iterable[str]] = None,
     ) -> List[MODEL]:
         """Find models using filters.
 
@@ -124,12 +143,48 @@ class SQLAlchemyAsyncRepositoryInterface(Generic[MODEL], ABC):
             # find all models with reversed order by `name` column
             find(order_by=[("name", "desc")])
 
+            # find all models, loading the `children` relationship
+            find(eager=["children"])
+
         :param search_params: A mapping containing equality filters
         :param order_by:
+        :param eager: A list of relationships to be eager loaded
         :return: A collection of models
         """
         ...
 
+    @abstractmethod
+    def find_iter(
+        self,
+        search_params: Union[None, Mapping[str, Any]] = None,
+        order_by: Union[
+            None,
+            Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
+        ] = None,
+    ) -> AsyncIterator[MODEL]:
+        """Find models using filters, streaming them from the database
+        instead of loading the whole result in memory.
+
+        Models are fetched in batches of `_max_query_limit` items. The
+        eager loading of collections using `joined` or `subquery` loading
+        strategies is not supported.
+
+        Unless the repository uses an external session, models are streamed
+        using a dedicated session, kept open until the iterator is exhausted
+        or closed, so other operations can run while iterating.
+
+        E.g.
+
+            # iterate all models with name = John
+            async for model in find_iter(search_params={"name":"John"}):
+                ...
+
+        :param search_params: A mapping containing equality filters
+        :param order_by:
+        :return: An iterator of models
+        """
+        ...
+
     @abstractmethod
     async def paginated_find(
         self,
@@ -244,10 +299,26 @@ class SQLAlchemyRepositoryInterface(Generic[MODEL], ABC):
         ...
 
     @abstractmethod
-    def delete(self, instance: MODEL) -> None:
+    def bulk_insert(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Insert many rows in a single statement, bypassing the ORM unit of work.
+
+        ORM events (i.e. `before_insert`, `after_insert`) are not triggered
+        and no model instance is returned or tracked by the session.
+
+        :param rows: A list of mappings of column names and values
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, entity: Union[MODEL, PRIMARY_KEY]) -> None:
         """Deletes a model.
 
-        :param instance: The model instance
+        When the primary key is passed, eligible models are deleted with
+        a single DELETE statement: ORM delete events and session
+        cascades are not triggered in this case.
+
+        :param entity: The model instance or the primary key
+        :raises ModelNotFoundError: No model has been found using the primary key
         """
         ...
 
@@ -267,6 +338,7 @@ class SQLAlchemyRepositoryInterface(Generic[MODEL], ABC):
             None,
             Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
         ] = None,
+        eager: Union[None, Iterable[str]] = None,
     ) -> List[MODEL]:
         """Find models using filters.
 
@@ -281,12 +353,48 @@ class SQLAlchemyRepositoryInterface(Generic[MODEL], ABC):
             # find all models with reversed order by `name` column
             find(order_by=[("name", "desc")])
 
+            # find all models, loading the `children` relationship
+            find(eager=["children"])
+
         :param search_params: A mapping containing equality filters
         :param order_by:
+        :param eager: A list of relationships to be eager loaded
         :return: A collection of models
         """
         ...
 
+    @abstractmethod
+    def find_iter(
+        self,
+        search_params: Union[None, Mapping[str, Any]] = None,
+        order_by: Union[
+            None,
+            Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
+        ] = None,
+    ) -> Iterator[MODEL]:
+        """Find models using filters, streaming them from the database
+        instead of loading the whole result in memory.
+
+        Models are fetched in batches of `_max_query_limit` items. The
+        eager loading of collections using `joined` or `subquery` loading
+        strategies is not supported.
+
+        Unless the repository uses an external session, models are streamed
+        using a dedicated session, kept open until the iterator is exhausted
+        or closed, so other operations can run while iterating.
+
+        E.g.
+
+            # iterate all models with name = John
+            for model in find_iter(search_params={"name":"John"}):
+                ...
+
+        :param search_params: A mapping containing equality filters
+        :param order_by:
+        :return: An iterator of models
+        """
+        ...
+
     @abstractmethod
     def paginated_find(
         self,
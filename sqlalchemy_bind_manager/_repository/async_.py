@@ -18,22 +18,46 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import asyncio
+import os
+import sys
+import warnings
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import (
     Any,
+    AsyncContextManager,
     AsyncIterator,
+    Callable,
+    Dict,
     Generic,
     Iterable,
     List,
     Literal,
     Mapping,
+    Sequence,
     Tuple,
     Type,
     Union,
 )
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Dialect,
+    Select,
+    Table,
+    bindparam,
+    event,
+    insert,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    Mapper,
+    ORMExecuteState,
+    class_mapper,
+    make_transient_to_detached,
+)
 
 from .._bind_manager import SQLAlchemyAsyncBind
 from .._session_handler import AsyncSessionHandler
@@ -51,6 +75,83 @@ from .common import (
 )
 from .result_presenters import CursorPaginatedResultPresenter, PaginatedResultPresenter
 
+LAZY_LOAD_WARNINGS_ENV_VAR = "NPLUSONE_ENABLED"
+
+
+def _warn_on_lazy_load(
+    repository_name: str, mapper: Mapper, orm_execute_state: ORMExecuteState
+) -> None:
+    """Emits a warning when a relationship gets lazy loaded from an instance
+    of the repository model.
+
+    :param repository_name: The name of the repository class
+    :type repository_name: str
+    :param mapper: The mapper of the repository model
+    :type mapper: Mapper
+    :param orm_execute_state: The ORM execution state passed by the event
+    :type orm_execute_state: ORMExecuteState
+    """
+    if (
+        not orm_execute_state.is_relationship_load
+        or orm_execute_state.lazy_loaded_from is None
+        or not orm_execute_state.lazy_loaded_from.mapper.isa(mapper)
+    ):
+        return
+
+    owner = orm_execute_state.lazy_loaded_from.class_.__name__
+    attr = orm_execute_state.loader_strategy_path[-1].key  # type: ignore
+    warnings.warn(
+        f"Lazy load on {owner}.{attr} from {repository_name}",
+        stacklevel=_caller_stacklevel(),
+    )
+
+
+def _caller_stacklevel() -> int:
+    """Finds the stack level of the code accessing the lazy loaded
+    attribute, skipping the SQLAlchemy and sqlalchemy_bind_manager frames.
+
+    :return: The stack level to use in `warnings.warn()` from the caller
+    """
+    # Starts from the caller frame, which is stack level 1
+    stacklevel = 1
+    frame = sys._getframe(1)
+    while frame.f_back is not None and frame.f_globals.get("__name__", "").startswith(
+        "sqlalchemy"
+    ):
+        frame = frame.f_back
+        stacklevel += 1
+    return stacklevel
+
+
+def _has_result_processor(column: ColumnElement[Any], dialect: Dialect) -> bool:
+    """Checks if the type of a column processes the values returned by the
+    driver, which would be skipped reading the rows from the driver connection.
+
+    :param column: A table column
+    :type column: ColumnElement[Any]
+    :param dialect: The dialect of a bind
+    :type dialect: Dialect
+    :return: True if the values returned by the driver are processed
+    :rtype: bool
+    """
+    try:
+        return column.type._cached_result_processor(dialect, None) is not None
+    except Exception:
+        # Some processors depend on the type returned by the driver
+        return True
+
+
+def _is_asyncpg(dialect: Dialect) -> bool:
+    """Checks if a dialect uses PostgreSQL with the asyncpg driver, which
+    allows using the driver connection directly for faster operations.
+
+    :param dialect: The dialect of a bind
+    :type dialect: Dialect
+    :return: True if the dialect uses asyncpg, False otherwise
+    :rtype: bool
+    """
+    return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
 
 class SQLAlchemyAsyncRepository(
     Generic[MODEL],
@@ -59,6 +160,12 @@ class SQLAlchemyAsyncRepository(
 ):
     _session_handler: AsyncSessionHandler
     _external_session: Union[AsyncSession, None]
+    _copy_threshold: Union[int, None] = None
+    _fast_read: bool = False
+    _fast_get_sql: Union[str, None] = None
+    _concurrent_pagination: bool = False
+    _lazy_load_warnings: bool = False
+    _lazy_load_hook: Union[Callable[[ORMExecuteState], None], None] = None
 
     def __init__(
         self,
@@ -83,7 +190,17 @@ class SQLAlchemyAsyncRepository(
         :raises ModelNotFoundError: No model has been found using the primary key
         """
         async with self._get_session(commit=False) as session:
-            model = await session.get(self._model, identifier)
+            statement = (
+                self._fast_get_statement(
+                    session.get_bind(self._model).dialect, identifier
+                )
+                if self._fast_read and self._external_session is None
+                else None
+            )
+            if statement is None:
+                model = await session.get(self._model, identifier)
+            else:
+                model = await self._fast_get(session, statement, identifier)
         if model is None:
             raise ModelNotFoundError("No rows found for provided primary key.")
         return model
@@ -94,12 +211,13 @@ class SQLAlchemyAsyncRepository(
         :param identifiers: A list of primary keys
         :return: A list of models
         """
-        stmt = select(self._model).where(
-            getattr(self._model, self._model_pk()).in_(identifiers)
-        )
+        stmt = self._get_many_query()
+        models: List[MODEL] = []
 
         async with self._get_session(commit=False) as session:
-            return [x for x in (await session.execute(stmt)).scalars()]
+            for params in self._get_many_params(identifiers):
+                models.extend((await session.execute(stmt, params)).scalars().all())
+            return models
 
     async def save(self, instance: MODEL) -> MODEL:
         """Persist a model.
@@ -121,29 +239,76 @@ class SQLAlchemyAsyncRepository(
         :param instances: A list of mapped objects to be persisted
         :return: The model instances after being persisted
         """
-        self._fail_if_invalid_models(instances)
+        # The same model could be passed more than once
+        _instances = list({id(x): x for x in instances}.values())
+        self._fail_if_invalid_models(_instances)
         async with self._get_session() as session:
-            session.add_all(instances)
+            dialect = session.get_bind(self._model).dialect
+            if not await self._copy_models(session, _instances, dialect):
+                params = self._bulk_insert_params(_instances, dialect)
+                if params is not None:
+                    result = await session.execute(self._bulk_insert_query(), params)
+                    self._populate_persisted_models(_instances, result.all())
+            session.add_all(_instances)
         return instances
 
-    async def delete(self, instance: MODEL) -> None:
+    async def bulk_insert(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Insert many rows in a single statement, bypassing the ORM unit of work.
+
+        ORM events (i.e. `before_insert`, `after_insert`) are not triggered
+        and no model instance is returned or tracked by the session.
+
+        :param rows: A list of mappings of column names and values
+        """
+        _rows = list(rows)
+        if not _rows:
+            return
+        async with self._get_session() as session:
+            await session.execute(insert(self._model), _rows)
+
+    async def delete(self, entity: Union[MODEL, PRIMARY_KEY]) -> None:
         """Deletes a model.
 
-        :param instance: The model instance
+        When the primary key is passed, eligible models are deleted with
+        a single DELETE statement: ORM delete events and session
+        cascades are not triggered in this case.
+
+        :param entity: The model instance or the primary key
+        :raises ModelNotFoundError: No model has been found using the primary key
         """
-        self._fail_if_invalid_models([instance])
+        if not isinstance(entity, (str, int, tuple, dict)):
+            self._fail_if_invalid_models([entity])
+            async with self._get_session() as session:
+                await session.delete(entity)
+            return
+
+        stmt = self._delete_by_pk_query(entity)
         async with self._get_session() as session:
-            await session.delete(instance)
+            if stmt is None:
+                model = await session.get(self._model, entity)
+                if model is not None:
+                    await session.delete(model)
+                deleted = model is not None
+            else:
+                result = await session.execute(stmt, {"identifier": entity})
+                deleted = result.rowcount > 0  # type: ignore
+        if not deleted:
+            raise ModelNotFoundError("No rows found for provided primary key.")
 
     async def delete_many(self, instances: Iterable[MODEL]) -> None:
         """Deletes a collection of models in a single transaction.
 
         :param instances: The model instances
         """
-        self._fail_if_invalid_models(instances)
+        _instances = list(instances)
+        self._fail_if_invalid_models(_instances)
+        stmt = self._delete_many_query(_instances)
         async with self._get_session() as session:
-            for instance in instances:
-                await session.delete(instance)
+            if stmt is None:
+                for instance in _instances:
+                    await session.delete(instance)
+            else:
+                await session.execute(stmt)
 
     async def find(
         self,
@@ -152,6 +317,7 @@ class SQLAlchemyAsyncRepository(
             None,
             Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
         ] = None,
+        eager: Union[None, Iterable[str]] = None,
     ) -> List[MODEL]:
         """Find models using filters.
 
@@ -166,15 +332,59 @@ class SQLAlchemyAsyncRepository(
             # find all models with reversed order by `name` column
             find(order_by=[("name", "desc")])
 
+            # find all models, loading the `children` relationship
+            find(eager=["children"])
+
         :param search_params: A mapping containing equality filters
         :param order_by:
+        :param eager: A list of relationships to be eager loaded
         :return: A collection of models
         """
+        stmt = self._find_query(search_params, order_by, eager)
+
+        async with self._get_session(commit=False) as session:
+            result = await session.execute(stmt, self._find_query_params(search_params))
+            return result.scalars().all()  # type: ignore
+
+    async def find_iter(
+        self,
+        search_params: Union[None, Mapping[str, Any]] = None,
+        order_by: Union[
+            None,
+            Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
+        ] = None,
+    ) -> AsyncIterator[MODEL]:
+        """Find models using filters, streaming them from the database
+        instead of loading the whole result in memory.
+
+        Models are fetched in batches of `_max_query_limit` items. The
+        eager loading of collections using `joined` or `subquery` loading
+        strategies is not supported.
+
+        Unless the repository uses an external session, models are streamed
+        using a dedicated session, kept open until the iterator is exhausted
+        or closed, so other operations can run while iterating.
+
+        E.g.
+
+            # iterate all models with name = John
+            async for model in find_iter(search_params={"name":"John"}):
+                ...
+
+        :param search_params: A mapping containing equality filters
+        :param order_by:
+        :return: An iterator of models
+        """
         stmt = self._find_query(search_params, order_by)
 
-        async with self._get_session() as session:
-            result = await session.execute(stmt)
-            return [x for x in result.scalars()]
+        async with self._get_session(commit=False, dedicated=True) as session:
+            result = await session.stream_scalars(
+                stmt,
+                self._find_query_params(search_params),
+                execution_options={"yield_per": self._max_query_limit},
+            )
+            async for model in result:
+                yield model
 
     async def paginated_find(
         self,
@@ -212,23 +422,27 @@ class SQLAlchemyAsyncRepository(
         :param order_by:
         :return: A collection of models
         """
+        items_per_page = self._sanitised_query_limit(items_per_page)
         find_stmt = self._find_query(search_params, order_by)
-        paginated_stmt = self._paginate_query_by_page(find_stmt, page, items_per_page)
+        params = self._find_query_params(search_params)
 
-        async with self._get_session() as session:
-            total_items_count = (
-                await session.execute(self._count_query(find_stmt))
-            ).scalar() or 0
-            result_items = [
-                x for x in (await session.execute(paginated_stmt)).scalars()
-            ]
-
-            return PaginatedResultPresenter.build_result(
-                result_items=result_items,
-                total_items_count=total_items_count,
-                page=page,
-                items_per_page=self._sanitised_query_limit(items_per_page),
+        if self._counted_pagination:
+            total_items_count, result_items = await self._counted_paginated_results(
+                find_stmt, page, items_per_page, params
             )
+        else:
+            total_items_count, result_items = await self._paginated_results(
+                find_stmt,
+                self._paginate_query_by_page(find_stmt, page, items_per_page),
+                params,
+            )
+
+        return PaginatedResultPresenter.build_result(
+            result_items=result_items,  # type: ignore
+            total_items_count=total_items_count,
+            page=page,
+            items_per_page=items_per_page,
+        )
 
     async def cursor_paginated_find(
         self,
@@ -262,7 +476,9 @@ class SQLAlchemyAsyncRepository(
         :param search_params: A mapping containing equality filters
         :return: A collection of models
         """
+        items_per_page = self._sanitised_query_limit(items_per_page)
         find_stmt = self._find_query(search_params)
+        params = self._find_query_params(search_params)
         paginated_stmt = self._cursor_paginated_query(
             find_stmt,
             cursor_reference=cursor_reference,
@@ -270,26 +486,314 @@ class SQLAlchemyAsyncRepository(
             items_per_page=items_per_page,
         )
 
-        async with self._get_session() as session:
+        total_items_count, result_items = await self._paginated_results(
+            find_stmt, paginated_stmt, params
+        )
+
+        return CursorPaginatedResultPresenter.build_result(
+            result_items=self._cursor_paginated_items(result_items, is_before_cursor),
+            total_items_count=total_items_count,
+            items_per_page=items_per_page,
+            cursor_reference=cursor_reference,
+            is_before_cursor=is_before_cursor,
+        )
+
+    async def _paginated_results(
+        self, find_stmt: Select, paginated_stmt: Select, params: Dict[str, Any]
+    ) -> Tuple[int, Sequence[MODEL]]:
+        """Runs the count and the paginated queries. When enabled by
+        `_concurrent_pagination` the queries run concurrently, each one
+        using a dedicated session (and database connection), not registered
+        in the scoped session of the concurrent tasks.
+
+        :param find_stmt: The query used to count the models
+        :type find_stmt: Select
+        :param paginated_stmt: The query used to retrieve the models
+        :type paginated_stmt: Select
+        :param params: The bound parameters values
+        :type params: Dict[str, Any]
+        :return: The total number of models and the models in the page
+        :rtype: Tuple[int, Sequence[MODEL]]
+        """
+        if self._concurrent_pagination and self._external_session is None:
+            total_items_count, result_items = await asyncio.gather(
+                self._count_items(find_stmt, params),
+                self._fetch_items(paginated_stmt, params),
+            )
+            return total_items_count, result_items
+
+        async with self._get_session(commit=False) as session:
+            total_items_count = await self._total_items_count(
+                session, find_stmt, params
+            )
+            result_items = (
+                (await session.execute(paginated_stmt, params)).scalars().all()
+            )
+        return total_items_count, result_items
+
+    async def _counted_paginated_results(
+        self,
+        find_stmt: Select,
+        page: int,
+        items_per_page: int,
+        params: Dict[str, Any],
+    ) -> Tuple[int, Sequence[MODEL]]:
+        """Runs the paginated query retrieving the total number of models
+        together with the page, when enabled by `_counted_pagination`.
+        The models are counted using a separate query only when the page
+        is empty.
+
+        :param find_stmt: The query used to retrieve the models
+        :type find_stmt: Select
+        :param page: Page to retrieve
+        :type page: int
+        :param items_per_page: Number of models to retrieve
+        :type items_per_page: int
+        :param params: The bound parameters values
+        :type params: Dict[str, Any]
+        :return: The total number of models and the models in the page
+        :rtype: Tuple[int, Sequence[MODEL]]
+        """
+        async with self._get_session(commit=False) as session:
+            total_items_count, result_items = self._counted_page_items(
+                (
+                    await session.execute(
+                        self._counted_paginated_query(find_stmt, page, items_per_page),
+                        params,
+                    )
+                ).all()
+            )
+            if total_items_count is None:
+                total_items_count = await self._total_items_count(
+                    session, find_stmt, params
+                )
+            return total_items_count, result_items
+
+    async def _count_items(self, stmt: Select, params: Dict[str, Any]) -> int:
+        async with self._get_session(commit=False, dedicated=True) as session:
+            return await self._total_items_count(session, stmt, params)
+
+    async def _total_items_count(
+        self, session: AsyncSession, find_stmt: Select, params: Dict[str, Any]
+    ) -> int:
+        cache_key = self._count_cache_key(session, find_stmt, params)
+        total_items_count = self._cached_count(cache_key)
+        if total_items_count is None:
             total_items_count = (
-                await session.execute(self._count_query(find_stmt))
+                await session.execute(self._count_query(find_stmt), params)
             ).scalar() or 0
-            result_items = [
-                x for x in (await session.execute(paginated_stmt)).scalars()
-            ] or []
-
-            return CursorPaginatedResultPresenter.build_result(
-                result_items=result_items,
-                total_items_count=total_items_count,
-                items_per_page=self._sanitised_query_limit(items_per_page),
-                cursor_reference=cursor_reference,
-                is_before_cursor=is_before_cursor,
+            self._cache_count(cache_key, total_items_count)
+        return total_items_count
+
+    async def _fetch_items(
+        self, stmt: Select, params: Dict[str, Any]
+    ) -> Sequence[MODEL]:
+        async with self._get_session(commit=False, dedicated=True) as session:
+            return (await session.execute(stmt, params)).scalars().all()
+
+    def _fast_get_statement(
+        self, dialect: Dialect, identifier: PRIMARY_KEY
+    ) -> Union[str, None]:
+        """Returns the SQL used to fetch a model by primary key directly from
+        the asyncpg driver, when enabled by `_fast_read`.
+
+        Only models mapped to a single table, without polymorphic loading,
+        with a single primary key column and without column types processing
+        the values returned by the driver are eligible.
+
+        :param dialect: The dialect of the bind used to fetch the model
+        :type dialect: Dialect
+        :param identifier: The primary key
+        :return: The SQL statement, or None if the model is not eligible
+        :rtype: Union[str, None]
+        """
+        mapper = self._model_metadata.mapper
+        if (
+            not _is_asyncpg(dialect)
+            or isinstance(identifier, (tuple, dict))
+            or self._model_metadata.pk_column is None
+            or len(mapper.tables) != 1
+            or mapper.polymorphic_on is not None
+            or any(_has_result_processor(c, dialect) for c in mapper.local_table.c)
+        ):
+            return None
+
+        if self._fast_get_sql is None:
+            table: Table = mapper.local_table  # type: ignore
+            stmt = select(*table.columns).where(
+                self._model_metadata.pk_column == bindparam("pk")
             )
+            self._fast_get_sql = str(stmt.compile(dialect=dialect))
+        return self._fast_get_sql
+
+    async def _fast_get(
+        self, session: AsyncSession, statement: str, identifier: PRIMARY_KEY
+    ) -> Union[MODEL, None]:
+        """Fetches a model by primary key using the asyncpg connection, without
+        going through the ORM. The model is returned detached from the session.
+
+        The repository session is not used for other statements, so the row
+        is read without starting the session transaction on the database,
+        saving a round trip.
+
+        :param session: The session used to fetch the model
+        :type session: AsyncSession
+        :param statement: The SQL statement built by `_fast_get_statement`
+        :type statement: str
+        :param identifier: The primary key
+        :return: A model instance, or None if no row has been found
+        :rtype: Union[MODEL, None]
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        row = await raw_connection.driver_connection.fetchrow(  # type: ignore
+            statement, identifier
+        )
+        if row is None:
+            return None
 
-    @asynccontextmanager
-    async def _get_session(self, commit: bool = True) -> AsyncIterator[AsyncSession]:
+        model = self._model_metadata.mapper.class_manager.new_instance()
+        self._populate_persisted_models([model], [tuple(row)])
+        return model
+
+    async def _copy_models(
+        self, session: AsyncSession, instances: List[MODEL], dialect: Dialect
+    ) -> bool:
+        """Persists new models using the PostgreSQL COPY protocol, when
+        enabled by `_copy_threshold` and the bind uses the asyncpg driver.
+
+        Only new models with all the primary key columns populated are
+        eligible, as COPY can't return the values generated by the database.
+        Models relying on column defaults (Python or server side), computed
+        or identity columns, or on column types processing the values
+        before sending them, are not eligible.
+
+        :param session: The session used to persist the models
+        :type session: AsyncSession
+        :param instances: The models to be persisted
+        :type instances: List[MODEL]
+        :param dialect: The dialect of the bind used to persist the models
+        :type dialect: Dialect
+        :return: True if the models have been persisted, False otherwise
+        :rtype: bool
+        """
+        if (
+            self._copy_threshold is None
+            or len(instances) < self._copy_threshold
+            or not _is_asyncpg(dialect)
+        ):
+            return False
+
+        params = self._new_models_params(instances)
+        table: Table = self._model_metadata.mapper.local_table  # type: ignore
+        if params is None or any(c.key not in params[0] for c in table.primary_key):
+            return False
+
+        # COPY sends the values as they are: Python side defaults and
+        # the type bind processors would not be applied. The values generated
+        # by the database are not returned, and could not be loaded in the
+        # detached models.
+        if any(
+            c.type._cached_bind_processor(dialect) is not None
+            if c.key in params[0]
+            else (
+                c.default is not None
+                or c.server_default is not None
+                or c.server_onupdate is not None
+                or c.computed is not None
+                or c.identity is not None
+            )
+            for c in table.columns
+        ):
+            return False
+
+        columns = list(params[0].keys())
+        driver_connection = await self._driver_connection(session)
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(p[c] for c in columns) for p in params],
+            columns=[table.c[c].name for c in columns],
+            schema_name=table.schema,
+        )
+        for instance in instances:
+            make_transient_to_detached(instance)
+        return True
+
+    async def _driver_connection(self, session: AsyncSession) -> Any:
+        """Returns the driver connection used by the session, after starting
+        the session transaction on the database.
+
+        The asyncpg adapter begins the transaction only when the first
+        statement is executed, so the operations performed directly on the
+        driver connection would otherwise run outside of it.
+
+        :param session: The session owning the connection
+        :type session: AsyncSession
+        :return: The driver connection
+        """
+        connection = await session.connection()
+        await connection.exec_driver_sql("SELECT 1")
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+
+    def _get_session(
+        self, commit: bool = True, dedicated: bool = False
+    ) -> AsyncContextManager[AsyncSession]:
         if not self._external_session:
-            async with self._session_handler.get_session(not commit) as _session:
-                yield _session
+            if dedicated:
+                session_context = self._session_handler.get_dedicated_session()
+            else:
+                session_context = self._session_handler.get_session(not commit)
         else:
-            yield self._external_session
+            session_context = self._get_external_session()
+
+        if self._lazy_load_warnings:
+            return self._warn_on_lazy_loads(session_context)
+        return session_context
+
+    @asynccontextmanager
+    async def _warn_on_lazy_loads(
+        self, session_context: AsyncContextManager[AsyncSession]
+    ) -> AsyncIterator[AsyncSession]:
+        if self._lazy_load_hook is None:
+            self._lazy_load_hook = partial(
+                _warn_on_lazy_load, type(self).__name__, class_mapper(self._model)
+            )
+        async with session_context as session:
+            # Listens on the session instance, leaving other sessions untouched
+            if not event.contains(
+                session.sync_session, "do_orm_execute", self._lazy_load_hook
+            ):
+                event.listen(
+                    session.sync_session, "do_orm_execute", self._lazy_load_hook
+                )
+            yield session
+
+    @asynccontextmanager
+    async def _get_external_session(self) -> AsyncIterator[AsyncSession]:
+        yield self._external_session  # type: ignore
+
+    @classmethod
+    def enable_lazy_load_warnings(cls) -> None:
+        """Emits a warning every time a relationship is lazy loaded from
+        the models of the repository.
+
+        `AsyncSession` does not support implicit lazy loading, this hook
+        helps identifying the relationships that need to be eagerly loaded.
+        It is meant to be used during development only.
+        """
+        cls._lazy_load_warnings = True
+
+    @classmethod
+    def disable_lazy_load_warnings(cls) -> None:
+        """Stops the hook enabled by `enable_lazy_load_warnings` for the
+        sessions used from now on."""
+        cls._lazy_load_warnings = False
+
+
+def _enable_lazy_load_warnings_from_env() -> None:
+    if os.environ.get(LAZY_LOAD_WARNINGS_ENV_VAR) == "1":
+        SQLAlchemyAsyncRepository.enable_lazy_load_warnings()
+
+
+_enable_lazy_load_warnings_from_env()
@@ -19,22 +19,49 @@
 #  DEALINGS IN THE SOFTWARE.
 
 from abc import ABC
-from functools import partial
+from time import monotonic
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
+    List,
     Literal,
     Mapping,
+    Sequence,
     Tuple,
     Type,
     Union,
 )
 
-from sqlalchemy import asc, desc, func, inspect, select
-from sqlalchemy.orm import Mapper, aliased, class_mapper, lazyload
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Dialect,
+    Insert,
+    asc,
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    select,
+    tuple_,
+)
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.orm import (
+    MANYTOONE,
+    ONETOMANY,
+    Mapper,
+    class_mapper,
+    joinedload,
+    lazyload,
+    make_transient_to_detached,
+    selectinload,
+)
+from sqlalchemy.orm.attributes import instance_state, set_committed_value
 from sqlalchemy.orm.exc import UnmappedClassError
 from sqlalchemy.sql import Select
 
@@ -42,59 +69,165 @@ from sqlalchemy_bind_manager.exceptions import InvalidModelError, UnmappedProper
 
 from .common import (
     MODEL,
+    PRIMARY_KEY,
     CursorReference,
 )
 
+_ORDER_BY_DIRECTIONS: Dict[Literal["asc", "desc"], Callable] = {
+    "asc": asc,
+    "desc": desc,
+}
+
+
+_LAZY_LOAD_ALL = lazyload("*")
+
+_MODEL_METADATA_INFO_KEY = "sqlalchemy_bind_manager_metadata"
+
+_FIND_QUERIES_CACHE_SIZE = 256
+
+_COUNT_CACHE_SIZE = 1024
+
+_GET_MANY_CHUNK_SIZE = 1000
+
+_NO_FILTERS: FrozenSet[Tuple[str, bool]] = frozenset()
+
+
+class _ModelMetadata:
+    """Mapping information about a model class, used to build queries
+    without inspecting the model mapper every time.
+
+    The metadata is shared by all the repositories using the same model,
+    and is stored in the model class manager, so that it is discarded
+    together with the mapper.
+    """
+
+    __slots__ = (
+        "columns",
+        "count_queries",
+        "counts",
+        "delete_query",
+        "find_queries",
+        "get_many_query",
+        "mapper",
+        "pk_column",
+        "primary_keys",
+        "relationships",
+    )
+
+    @classmethod
+    def for_mapper(cls, mapper: Mapper) -> "_ModelMetadata":
+        info = mapper.class_manager.info
+        metadata = info.get(_MODEL_METADATA_INFO_KEY)
+        if metadata is None or metadata.mapper is not mapper:
+            metadata = info[_MODEL_METADATA_INFO_KEY] = cls(mapper)
+        return metadata
+
+    def __init__(self, mapper: Mapper) -> None:
+        self.mapper = mapper
+        self.find_queries: Dict[Tuple, Select] = {}
+        self.count_queries: Dict[Select, Select] = {}
+        self.counts: Dict[Tuple, Tuple[int, float]] = {}
+        self.get_many_query: Union[Select, None] = None
+        self.delete_query: Union[Delete, None] = None
+        self.columns: Dict[str, Any] = {
+            key: getattr(mapper.class_, key) for key in mapper.column_attrs.keys()
+        }
+        self.primary_keys = tuple(mapper.primary_key)
+        self.pk_column = self.primary_keys[0] if len(self.primary_keys) == 1 else None
+        self.relationships: Dict[str, Any] = {
+            key: getattr(mapper.class_, key) for key in mapper.relationships.keys()
+        }
+
 
 class BaseRepository(Generic[MODEL], ABC):
+    _bulk_delete_many: bool = False
+    _bulk_save_many: bool = False
+    _count_cache_ttl: Union[float, None] = None
+    _counted_pagination: bool = False
+    _deferred_join_pagination: bool = False
     _max_query_limit: int = 50
     _model: Type[MODEL]
+    _model_metadata: _ModelMetadata
 
     def __init__(self, model_class: Union[Type[MODEL], None] = None) -> None:
         if getattr(self, "_model", None) is None and model_class is not None:
             self._model = model_class
 
-        if getattr(self, "_model", None) is None or not self._is_mapped_class(
-            self._model
-        ):
+        try:
+            mapper = class_mapper(getattr(self, "_model", None))  # type: ignore
+        except (ArgumentError, UnmappedClassError):
             raise InvalidModelError(
                 "You need to supply a valid model class"
                 " either in the `model_class` parameter"
                 " or in the `_model` class property."
             )
+        self._model_metadata = _ModelMetadata.for_mapper(mapper)
 
-    def _is_mapped_class(self, class_: Type[MODEL]) -> bool:
-        """Checks if the class is mapped in SQLAlchemy.
+    def _mapped_column(self, property_name: str) -> Any:
+        """Retrieves a property mapped in the model class.
 
-        :param class_: the model class
-        :return: True if the Type is mapped, False otherwise
-        :rtype: bool
+        :param property_name: The name of the property to be retrieved.
+        :type property_name: str
+        :return: The mapped column attribute
+        :raises UnmappedPropertyError: When the property is not mapped.
         """
         try:
-            class_mapper(class_)
-            return True
-        except UnmappedClassError:
-            return False
+            return self._model_metadata.columns[property_name]
+        except KeyError:
+            raise UnmappedPropertyError(
+                f"Property `{property_name}` is not mapped"
+                f" in the ORM for model `{self._model}`"
+            )
 
-    def _validate_mapped_property(self, property_name: str) -> None:
-        """Checks if a property is mapped in the model class.
+    def _mapped_relationship(self, relationship_name: str) -> Any:
+        """Retrieves a relationship mapped in the model class.
 
-        :param property_name: The name of the property to be evaluated.
-        :type property_name: str
-        :raises UnmappedPropertyError: When the property is not mapped.
+        :param relationship_name: The name of the relationship to be retrieved.
+        :type relationship_name: str
+        :return: The mapped relationship attribute
+        :raises UnmappedPropertyError: When the relationship is not mapped.
         """
-        m: Mapper = class_mapper(self._model)
-        if property_name not in m.column_attrs:
+        try:
+            return self._model_metadata.relationships[relationship_name]
+        except KeyError:
             raise UnmappedPropertyError(
-                f"Property `{property_name}` is not mapped"
+                f"Relationship `{relationship_name}` is not mapped"
                 f" in the ORM for model `{self._model}`"
             )
 
+    def _eager_load(self, stmt: Select, eager: Iterable[str]) -> Select:
+        """Adds the loader options to eager load the submitted relationships.
+
+        Collections are loaded using `selectinload`, to avoid multiplying
+        the returned rows, while many-to-one relationships are loaded using
+        `joinedload`.
+
+        :param stmt: a Select statement
+        :type stmt: Select
+        :param eager: a list of relationship names
+        :type eager: Iterable[str]
+        :return: The query with the loader options
+        """
+        options = []
+        mapped_relationship = self._mapped_relationship
+        for name in eager:
+            relationship = mapped_relationship(name)
+            if relationship.property.uselist:
+                options.append(selectinload(relationship))
+            else:
+                options.append(joinedload(relationship))
+        return stmt.options(*options) if options else stmt
+
     def _filter_select(self, stmt: Select, search_params: Mapping[str, Any]) -> Select:
         """Build the query filtering clauses from submitted parameters.
 
+        Values are not embedded in the query but referenced by bound
+        parameters, so that the query can be reused with different values.
+        Use `_find_query_params()` to build the parameters for execution.
+
         E.g.
-        _filter_select(stmt, name="John") adds a `WHERE name = John` statement
+        _filter_select(stmt, name="John") adds a `WHERE name = :search_name`
+        statement
 
         :param stmt: a Select statement
         :type stmt: Select
@@ -102,16 +235,32 @@ class BaseRepository(Generic[MODEL], ABC):
         :type search_params: Mapping[str, Any]
         :return: The filtered query
         """
-        # TODO: Add support for relationship eager load
+        mapped_column = self._mapped_column
+        clauses = []
         for k, v in search_params.items():
             """
             This acts as a TypeGuard but using TypeGuard typing would break
             compatibility with python < 3.10, for the moment we prefer to ignore
             typing issues here
             """
-            self._validate_mapped_property(k)
-            stmt = stmt.where(getattr(self._model, k) == v)
-        return stmt
+            column = mapped_column(k)
+            clauses.append(
+                column.is_(None) if v is None else column == bindparam(f"search_{k}")
+            )
+        return stmt.where(*clauses) if clauses else stmt
+
+    @staticmethod
+    def _find_query_params(
+        search_params: Union[None, Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Build the parameters to execute a query built by `_find_query()`.
+
+        :param search_params: Any keyword argument to be used as equality filter
+        :return: The bound parameters values
+        """
+        if not search_params:
+            return {}
+        return {f"search_{k}": v for k, v in search_params.items() if v is not None}
 
     def _filter_order_by(
         self,
@@ -131,22 +280,15 @@ class BaseRepository(Generic[MODEL], ABC):
         :param order_by: a list of columns, or tuples (column, direction)
         :return: The filtered query
         """
-        _partial_registry: Dict[Literal["asc", "desc"], Callable] = {
-            "desc": partial(desc),
-            "asc": partial(asc),
-        }
-
+        mapped_column = self._mapped_column
+        clauses = []
         for value in order_by:
             if isinstance(value, str):
-                self._validate_mapped_property(value)
-                stmt = stmt.order_by(getattr(self._model, value))
+                clauses.append(mapped_column(value))
             else:
-                self._validate_mapped_property(value[0])
-                stmt = stmt.order_by(
-                    _partial_registry[value[1]](getattr(self._model, value[0]))
-                )
+                clauses.append(_ORDER_BY_DIRECTIONS[value[1]](mapped_column(value[0])))
 
-        return stmt
+        return stmt.order_by(*clauses) if clauses else stmt
 
     def _find_query(
         self,
@@ -155,8 +297,14 @@ class BaseRepository(Generic[MODEL], ABC):
             None,
             Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
         ] = None,
+        eager: Union[None, Iterable[str]] = None,
     ) -> Select:
-        """Build a query with column filters and orders.
+        """Build a query with column filters, orders and eager loaded relationships.
+
+        Queries are cached, so that they are built and compiled only once
+        for each combination of filters, orders and relationships. Filter
+        values have to be provided at execution using `_find_query_params()`.
+        When the cache is full, the oldest query is discarded.
 
         E.g.
         q = _find_query(search_params={"name":"John"})
@@ -170,24 +318,155 @@ class BaseRepository(Generic[MODEL], ABC):
 
         :param search_params: Any keyword argument to be used as equality filter
         :param order_by: a list of columns, or tuples (column, direction)
+        :param eager: a list of relationships to be eager loaded
         :return: The filtered query
         """
+        _order_by: Union[None, Tuple] = None
+        if order_by is not None:
+            _order_by = tuple(order_by)
+            try:
+                hash(_order_by)
+            except TypeError:
+                # Directions passed as lists need to be converted to tuples
+                _order_by = tuple(
+                    x if isinstance(x, str) else tuple(x) for x in _order_by
+                )
+        _eager = tuple(eager) if eager is not None else None
+        # Skip the generator machinery for the common no filter
+        # and single filter cases.
+        if not search_params:
+            filters_key = _NO_FILTERS
+        elif len(search_params) == 1:
+            ((k, v),) = search_params.items()
+            filters_key = frozenset(((k, v is None),))
+        else:
+            filters_key = frozenset((k, v is None) for k, v in search_params.items())
+        cache_key = (
+            filters_key,
+            _order_by,
+            _eager,
+        )
+        cached_stmt = self._model_metadata.find_queries.get(cache_key)
+        if cached_stmt is not None:
+            return cached_stmt
+
         stmt = select(self._model)
 
         if search_params:
             stmt = self._filter_select(stmt, search_params)
-        if order_by is not None:
-            stmt = self._filter_order_by(stmt, order_by)
+        if _order_by is not None:
+            stmt = self._filter_order_by(stmt, _order_by)  # type: ignore
+        if _eager is not None:
+            stmt = self._eager_load(stmt, _eager)
+
+        find_queries = self._model_metadata.find_queries
+        if len(find_queries) >= _FIND_QUERIES_CACHE_SIZE:
+            find_queries.pop(next(iter(find_queries)), None)
+        find_queries[cache_key] = stmt
+        return stmt
 
+    def _get_many_query(self) -> Select:
+        """Build a query retrieving models by primary keys.
+
+        The query is cached, the primary keys have to be provided
+        at execution in the `identifiers` parameter.
+
+        :return: The query
+        :raises NotImplementedError: The model has a composite primary key
+        """
+        stmt = self._model_metadata.get_many_query
+        if stmt is None:
+            stmt = select(self._model).where(
+                self._model_pk_column().in_(bindparam("identifiers", expanding=True))
+            )
+            self._model_metadata.get_many_query = stmt
         return stmt
 
+    @staticmethod
+    def _get_many_params(identifiers: Iterable[PRIMARY_KEY]) -> List[Dict[str, Any]]:
+        """Build the parameters to execute the query built by `_get_many_query()`.
+
+        The primary keys are split in chunks, each one to be used in a
+        different query, to stay within the databases limits on the
+        number of bound parameters.
+
+        :param identifiers: A list of primary keys
+        :type identifiers: Iterable[PRIMARY_KEY]
+        :return: The bound parameters values for each query
+        """
+        _identifiers = list(identifiers)
+        return [
+            {"identifiers": _identifiers[i : i + _GET_MANY_CHUNK_SIZE]}
+            for i in range(0, len(_identifiers), _GET_MANY_CHUNK_SIZE)
+        ]
+
     def _count_query(
         self,
         query: Select,
     ) -> Select:
-        return select(func.count()).select_from(
-            query.options(lazyload("*")).subquery()  # type: ignore
-        )
+        """Build a query counting the rows returned by a query.
+
+        Count queries are cached by the counted query, so that counting
+        the same cached find query doesn't build a new statement. When
+        the cache is full, the oldest query is discarded.
+
+        :param query: a Select statement
+        :type query: Select
+        :return: The count query
+        """
+        count_queries = self._model_metadata.count_queries
+        stmt = count_queries.get(query)
+        if stmt is None:
+            stmt = self._build_count_query(query)
+            if len(count_queries) >= _FIND_QUERIES_CACHE_SIZE:
+                count_queries.pop(next(iter(count_queries)), None)
+            count_queries[query] = stmt
+        return stmt
+
+    def _build_count_query(
+        self,
+        query: Select,
+    ) -> Select:
+        """Build a query counting the rows returned by a query.
+
+        Queries on the model table using only filters are counted
+        directly, other queries are wrapped in a subquery selecting a
+        single column, unless they are distinct or grouped. Ordering is
+        dropped, unless it is needed to apply limit or offset.
+
+        :param query: a Select statement
+        :type query: Select
+        :return: The count query
+        """
+        mapper = self._model_metadata.mapper
+        if (
+            not mapper.single
+            and query.get_final_froms() == [mapper.local_table]
+            and not query._distinct
+            and not query._group_by_clauses
+            and not query._having_criteria
+            and query._limit_clause is None
+            and query._offset_clause is None
+        ):
+            # Selecting from the model keeps the ORM criteria hooks working
+            stmt = select(func.count()).select_from(self._model)
+            if query.whereclause is not None:
+                stmt = stmt.where(query.whereclause)
+            return stmt
+
+        if query._limit_clause is None and query._offset_clause is None:
+            query = query.order_by(None)
+        if query._distinct or query._group_by_clauses:
+            # The selected columns affect the number of rows
+            query = query.options(_LAZY_LOAD_ALL)
+        else:
+            # Selecting a model attribute instead of the model entity
+            # keeps the inheritance criteria and skips eager loading
+            query = query.with_only_columns(
+                next(iter(self._model_metadata.columns.values())),
+                maintain_column_froms=True,
+            )
+        return select(func.count()).select_from(query.subquery())
 
     def _paginate_query_by_page(
         self,
@@ -197,6 +476,9 @@ class BaseRepository(Generic[MODEL], ABC):
     ) -> Select:
         """Build the query offset and limit clauses from submitted parameters.
 
+        When `_deferred_join_pagination` is enabled, pages after the first
+        one are retrieved using a deferred join.
+
         :param stmt: a Select statement
         :type stmt: Select
         :param page: Number of models to skip
@@ -206,14 +488,153 @@ class BaseRepository(Generic[MODEL], ABC):
         :return: The filtered query
         """
 
-        _offset = max((page - 1) * items_per_page, 0)
-        if _offset > 0:
-            stmt = stmt.offset(_offset)
+        _limit = self._sanitised_query_limit(items_per_page)
+        _offset = max((page - 1) * _limit, 0)
+
+        if _offset > 0 and self._deferred_join_pagination:
+            deferred_stmt = self._paginate_query_by_page_deferred_join(
+                stmt, _offset, _limit
+            )
+            if deferred_stmt is not None:
+                return deferred_stmt
+
+        return stmt.slice(_offset, _offset + _limit)
+
+    def _counted_paginated_query(
+        self,
+        stmt: Select,
+        page: int,
+        items_per_page: int,
+    ) -> Select:
+        """Build the query offset and limit clauses from submitted parameters,
+        adding the total number of models matching the query to each row
+        using a `COUNT(*) OVER ()` window function.
+
+        Use `_counted_page_items()` to split the rows returned by the query.
 
+        :param stmt: a Select statement
+        :type stmt: Select
+        :param page: Number of models to skip
+        :type page: int
+        :param items_per_page: Number of models to retrieve
+        :type items_per_page: int
+        :return: The paginated query
+        """
         _limit = self._sanitised_query_limit(items_per_page)
-        stmt = stmt.limit(_limit)
+        _offset = max((page - 1) * _limit, 0)
+        return stmt.add_columns(func.count().over()).slice(_offset, _offset + _limit)
 
-        return stmt
+    def _count_cache_key(
+        self, session: Any, query: Select, params: Dict[str, Any]
+    ) -> Union[Tuple, None]:
+        """Build the key to cache the number of models returned by a query,
+        when enabled by `_count_cache_ttl`.
+
+        :param session: The session used to count the models
+        :type session: Any
+        :param query: The query used to count the models
+        :type query: Select
+        :param params: The bound parameters values
+        :type params: Dict[str, Any]
+        :return: The cache key, or None if the count can't be cached
+        """
+        if self._count_cache_ttl is None:
+            return None
+        try:
+            return (session.get_bind(self._model), query, frozenset(params.items()))
+        except TypeError:
+            # Unhashable parameter values
+            return None
+
+    def _cached_count(self, key: Union[Tuple, None]) -> Union[int, None]:
+        """Returns the cached number of models, if not expired.
+
+        :param key: The key built by `_count_cache_key()`
+        :type key: Union[Tuple, None]
+        :return: The number of models, or None if not cached
+        """
+        if key is None:
+            return None
+        cached = self._model_metadata.counts.get(key)
+        if cached is None or cached[1] < monotonic():
+            return None
+        return cached[0]
+
+    def _cache_count(self, key: Union[Tuple, None], count: int) -> None:
+        """Caches the number of models for `_count_cache_ttl` seconds.
+        When the cache is full, the oldest count is discarded.
+
+        :param key: The key built by `_count_cache_key()`
+        :type key: Union[Tuple, None]
+        :param count: The number of models
+        :type count: int
+        """
+        if key is None:
+            return
+        counts = self._model_metadata.counts
+        if key not in counts and len(counts) >= _COUNT_CACHE_SIZE:
+            counts.pop(next(iter(counts)), None)
+        counts[key] = (count, monotonic() + self._count_cache_ttl)  # type: ignore
+
+    @staticmethod
+    def _counted_page_items(
+        rows: Sequence[Sequence[Any]],
+    ) -> Tuple[Union[int, None], List[MODEL]]:
+        """Splits the rows returned by a query built by
+        `_counted_paginated_query()` in the total number of models and
+        the models in the page.
+
+        The total number of models is unknown (None) when the page is empty.
+
+        :param rows: The rows returned by the query
+        :type rows: Sequence[Sequence[Any]]
+        :return: The total number of models and the models in the page
+        """
+        if not rows:
+            return None, []
+        return rows[0][1], [row[0] for row in rows]
+
+    def _paginate_query_by_page_deferred_join(
+        self,
+        stmt: Select,
+        offset: int,
+        limit: int,
+    ) -> Union[Select, None]:
+        """Build a query applying offset and limit to a subquery selecting
+        only the primary keys, joined back to the model table.
+
+        The database skips the offset rows reading only the primary keys
+        (i.e. from an index) and loads the full rows only for the page.
+
+        Only queries on the model table using filters and ordering are
+        eligible, for models with a single primary key.
+
+        :param stmt: a Select statement
+        :type stmt: Select
+        :param offset: Number of models to skip
+        :type offset: int
+        :param limit: Number of models to retrieve
+        :type limit: int
+        :return: The paginated query, or None if the query is not eligible
+        """
+        mapper = self._model_metadata.mapper
+        if (
+            self._model_metadata.pk_column is None
+            or mapper.single
+            or stmt.get_final_froms() != [mapper.local_table]
+            or stmt._distinct
+            or stmt._group_by_clauses
+            or stmt._having_criteria
+        ):
+            return None
+
+        pk = self._model_pk_column()
+        page_keys = (
+            stmt.with_only_columns(pk)
+            .slice(offset, offset + limit)
+            .subquery("page_keys")
+        )
+        return stmt.join(page_keys, pk == page_keys.c[0])
 
     def _cursor_paginated_query(
         self,
@@ -226,6 +647,9 @@ class BaseRepository(Generic[MODEL], ABC):
         or before the cursor value, plus a model before the slice and one after
         the slice, to identify if previous or next results are available.
 
+        Models before the cursor are returned in descending order, use
+        `_cursor_paginated_items()` to restore the ascending order.
+
         :param stmt: a Select statement
         :type stmt: Select
         :param cursor_reference: A cursor reference containing ordering column
@@ -242,101 +666,181 @@ class BaseRepository(Generic[MODEL], ABC):
 
         if not cursor_reference:
             return stmt.limit(forward_limit).order_by(  # type: ignore
-                asc(self._model_pk())
+                asc(self._model_pk_column())
+            )
+
+        column = self._mapped_column(cursor_reference.column)
+        pk_column = self._model_metadata.pk_column
+        if pk_column is None or column.property.columns[0] is pk_column:
+            # The column values are unique, or there's no single column
+            # to order the models with the same value
+            boundary = self._cursor_pagination_boundary(
+                stmt, column, cursor_reference, is_before_cursor
+            )
+            if not is_before_cursor:
+                return (
+                    stmt.where(column >= boundary)
+                    .order_by(asc(column))
+                    .limit(forward_limit + 1)
+                )
+            return (
+                stmt.where(column <= boundary)
+                .order_by(desc(column))
+                .limit(forward_limit + 1)
             )
 
-        previous_query = self._cursor_pagination_previous_item_query(
-            stmt, cursor_reference, is_before_cursor
-        ).subquery("previous")
-
-        page_query = self._cursor_pagination_slice_query(
-            stmt, cursor_reference, forward_limit, is_before_cursor
-        ).subquery("slice")
-
-        query = select(
-            aliased(
-                self._model,
-                select(previous_query)
-                .union_all(select(page_query))
-                .order_by(cursor_reference.column)
-                .subquery("cursor_pagination"),  # type: ignore
+        position = tuple_(column, pk_column)
+        boundary_position = self._cursor_pagination_boundary_position(
+            stmt, column, pk_column, cursor_reference, is_before_cursor
+        )
+        if not is_before_cursor:
+            return (
+                stmt.where(position >= boundary_position)
+                .order_by(asc(column), asc(pk_column))
+                .limit(forward_limit + 1)
             )
+        return (
+            stmt.where(position <= boundary_position)
+            .order_by(desc(column), desc(pk_column))
+            .limit(forward_limit + 1)
         )
-        return query
 
-    def _cursor_pagination_slice_query(
-        self,
+    @staticmethod
+    def _cursor_paginated_items(
+        result_items: Sequence[MODEL], is_before_cursor: bool
+    ) -> List[MODEL]:
+        """Returns the models retrieved by `_cursor_paginated_query()`
+        in ascending order.
+
+        :param result_items: The models retrieved by the query
+        :type result_items: Sequence[MODEL]
+        :param is_before_cursor: If True the query returned items before
+            the cursor
+        :type is_before_cursor: bool
+        :return: The models in ascending order
+        """
+        if is_before_cursor:
+            return list(reversed(result_items))
+        return result_items if isinstance(result_items, list) else list(result_items)
+
+    @staticmethod
+    def _cursor_pagination_boundary(
         stmt: Select,
+        column: Any,
         cursor_reference: CursorReference,
-        limit: int,
         is_before_cursor: bool,
-    ):
-        """Adds the clauses to retrieve a requested slice of models,
-        after or before the cursor value (excluding the cursor itself)
+    ) -> ColumnElement:
+        """Builds the value of the model adjacent to the requested slice of
+        models, on the cursor side (including the cursor itself). The value
+        falls back to the cursor value, when such model doesn't exist.
+
+        Filtering the slice starting from this value returns both the slice
+        and the adjacent model, used to identify if previous (or next, when
+        retrieving models before the cursor) results are available.
 
         :param stmt: a Select statement
         :type stmt: Select
+        :param column: The mapped column referenced by the cursor
+        :type column: Any
         :param cursor_reference: A cursor reference containing ordering column
             and threshold value
-        :type cursor_reference: Union[CursorReference, None]
+        :type cursor_reference: CursorReference
         :param is_before_cursor: If True it will return items before the cursor,
             otherwise items after
         :type is_before_cursor: bool
-        :param limit: Number of models to retrieve
-        :type limit: int
-        :return: The filtered query
+        :return: The boundary value expression
         """
+        cursor_value = bindparam(
+            "cursor_value", cursor_reference.value, type_=column.type
+        )
         if not is_before_cursor:
-            page_query = stmt.where(
-                getattr(self._model, cursor_reference.column) > cursor_reference.value
-            )
-            page_query = self._filter_order_by(
-                page_query, [(cursor_reference.column, "asc")]
+            boundary_query = stmt.with_only_columns(func.max(column)).where(
+                column <= cursor_value
             )
         else:
-            page_query = stmt.where(
-                getattr(self._model, cursor_reference.column) < cursor_reference.value
-            )
-            page_query = self._filter_order_by(
-                page_query, [(cursor_reference.column, "desc")]
+            boundary_query = stmt.with_only_columns(func.min(column)).where(
+                column >= cursor_value
             )
-        return page_query.limit(limit)
 
-    def _cursor_pagination_previous_item_query(
-        self, stmt: Select, cursor_reference: CursorReference, is_before_cursor: bool
-    ) -> Select:
-        """Adds the clauses to retrieve a single model, after or before
-        the cursor value (including the cursor itself).
+        return func.coalesce(
+            boundary_query.order_by(None).correlate(None).scalar_subquery(),
+            cursor_value,
+        )
+
+    @staticmethod
+    def _cursor_pagination_boundary_position(
+        stmt: Select,
+        column: Any,
+        pk_column: Any,
+        cursor_reference: CursorReference,
+        is_before_cursor: bool,
+    ) -> ColumnElement:
+        """Builds the position, as column and primary key values, of the model
+        adjacent to the requested slice of models, on the cursor side
+        (including the cursor itself), to order the models with the same
+        column value by primary key.
+
+        The position falls back to the cursor position, when such model
+        doesn't exist.
 
         :param stmt: a Select statement
         :type stmt: Select
+        :param column: The mapped column referenced by the cursor
+        :type column: Any
+        :param pk_column: The primary key column of the model
+        :type pk_column: Any
         :param cursor_reference: A cursor reference containing ordering column
-            and threshold value
-        :type cursor_reference: Union[CursorReference, None]
+            and threshold values
+        :type cursor_reference: CursorReference
         :param is_before_cursor: If True it will return items before the cursor,
             otherwise items after
         :type is_before_cursor: bool
-        :return: The filtered query
+        :return: The boundary position expression
         """
+        cursor_value = bindparam(
+            "cursor_value", cursor_reference.value, type_=column.type
+        )
+        cursor_pk_value = bindparam(
+            "cursor_pk_value", cursor_reference.pk_value, type_=pk_column.type
+        )
+        stmt = stmt.order_by(None).correlate(None)
+        aggregate: Callable[..., ColumnElement]
         if not is_before_cursor:
-            previous_query = stmt.where(
-                getattr(self._model, cursor_reference.column) <= cursor_reference.value
-            )
-            previous_query = self._filter_order_by(
-                previous_query, [(cursor_reference.column, "desc")]
+            # Without a primary key the cursor is after the models with
+            # the same column value
+            cursor_side = (
+                column <= cursor_value
+                if cursor_reference.pk_value is None
+                else tuple_(column, pk_column) <= tuple_(cursor_value, cursor_pk_value)
             )
+            aggregate = func.max
         else:
-            previous_query = stmt.where(
-                getattr(self._model, cursor_reference.column) >= cursor_reference.value
-            )
-            previous_query = self._filter_order_by(
-                previous_query, [(cursor_reference.column, "asc")]
+            cursor_side = (
+                column >= cursor_value
+                if cursor_reference.pk_value is None
+                else tuple_(column, pk_column) >= tuple_(cursor_value, cursor_pk_value)
             )
+            aggregate = func.min
 
-        return previous_query.limit(1)
+        boundary_value = func.coalesce(
+            stmt.with_only_columns(aggregate(column))
+            .where(cursor_side)
+            .scalar_subquery(),
+            cursor_value,
+        )
+        boundary_pk_value = func.coalesce(
+            stmt.with_only_columns(aggregate(pk_column))
+            .where(cursor_side, column == boundary_value)
+            .scalar_subquery(),
+            cursor_pk_value,
+        )
+        return tuple_(boundary_value, boundary_pk_value)
 
-    def _sanitised_query_limit(self, limit):
-        return max(min(limit, self._max_query_limit), 0)
+    def _sanitised_query_limit(self, limit: int) -> int:
+        max_query_limit = self._max_query_limit
+        if limit <= 0:
+            return 0
+        return limit if limit < max_query_limit else max_query_limit
 
     def _model_pk(self) -> str:
         """
@@ -344,14 +848,207 @@ class BaseRepository(Generic[MODEL], ABC):
 
         :return:
         """
-        primary_keys = inspect(self._model).primary_key  # type: ignore
-        if len(primary_keys) > 1:
+        return self._model_pk_column().name
+
+    def _model_pk_column(self) -> ColumnElement:
+        """
+        Retrieves the primary key column from the repository model class.
+
+        :return: The primary key column
+        :raises NotImplementedError: The model has a composite primary key
+        """
+        pk_column = self._model_metadata.pk_column
+        if pk_column is None:
             raise NotImplementedError("Composite primary keys are not supported.")
 
-        return primary_keys[0].name
+        return pk_column
+
+    def _new_models_params(
+        self, instances: Sequence[MODEL]
+    ) -> Union[List[Dict[str, Any]], None]:
+        """Extracts the column values from new models, to persist them
+        without using the ORM unit of work.
+
+        Only new models of the repository class, having the same populated
+        columns and no populated relationships, are eligible. Models with
+        insert event listeners are not eligible, as the events would not
+        be triggered.
+
+        :param instances: The models to be persisted
+        :type instances: Sequence[MODEL]
+        :return: The column values keyed by column, or None if the models
+            are not eligible
+        """
+        mapper = self._model_metadata.mapper
+        if (
+            len(mapper.tables) > 1
+            or mapper.version_id_col is not None
+            or mapper.dispatch.before_insert
+            or mapper.dispatch.after_insert
+        ):
+            return None
+
+        column_keys = {
+            mapper.get_property_by_column(column).key: column.key
+            for column in mapper.local_table.columns
+        }
+        other_keys = [k for k in mapper.attrs.keys() if k not in column_keys]
+
+        params: List[Dict[str, Any]] = []
+        for instance in instances:
+            state = instance_state(instance)
+            if (
+                type(instance) is not self._model
+                or not state.transient
+                or any(k in state.dict for k in other_keys)
+            ):
+                return None
+            params.append(
+                {
+                    column_key: state.dict[attr_key]
+                    for attr_key, column_key in column_keys.items()
+                    if attr_key in state.dict
+                }
+            )
+
+        if any(p.keys() != params[0].keys() for p in params):
+            return None
+
+        return params
+
+    def _bulk_insert_params(
+        self, instances: Sequence[MODEL], dialect: Dialect
+    ) -> Union[List[Dict[str, Any]], None]:
+        """Builds the parameters to persist the models using a single
+        INSERT..RETURNING statement, instead of the ORM unit of work,
+        when enabled by `_bulk_save_many`.
+
+        Only new models with a primary key generated by the database
+        are eligible.
+
+        :param instances: The models to be persisted
+        :type instances: Sequence[MODEL]
+        :param dialect: The dialect of the bind used to persist the models
+        :type dialect: Dialect
+        :return: The INSERT parameters, or None if the models are not eligible
+        """
+        if (
+            not self._bulk_save_many
+            or len(instances) < 2
+            or not dialect.insert_executemany_returning_sort_by_parameter_order
+        ):
+            return None
+
+        params = self._new_models_params(instances)
+        if params is None or any(
+            column.key in params[0] for column in self._model_metadata.primary_keys
+        ):
+            return None
+
+        return params
+
+    def _bulk_insert_query(self) -> Insert:
+        table = self._model_metadata.mapper.local_table
+        return insert(table).returning(  # type: ignore
+            *table.columns, sort_by_parameter_order=True
+        )
+
+    def _populate_persisted_models(
+        self, instances: Sequence[MODEL], rows: Sequence[Sequence[Any]]
+    ) -> None:
+        """Populates the models with the values of their table rows and marks
+        them as persisted, so that they can be added to a session without
+        being inserted again.
+
+        :param instances: The persisted models
+        :type instances: Sequence[MODEL]
+        :param rows: The rows containing all the table columns,
+            in the same order of the models
+        :type rows: Sequence[Sequence[Any]]
+        """
+        mapper = self._model_metadata.mapper
+        for instance, row in zip(instances, rows):
+            for column, value in zip(mapper.local_table.columns, row):
+                set_committed_value(
+                    instance, mapper.get_property_by_column(column).key, value
+                )
+            make_transient_to_detached(instance)
+
+    def _delete_by_pk_query(self, identifier: PRIMARY_KEY) -> Union[Delete, None]:
+        """Builds a DELETE statement for a model primary key, to avoid loading
+        the model before deleting it.
+
+        Models with composite primary keys, multiple tables, version
+        counters or relationships requiring the ORM to update or delete
+        related rows are not supported.
+
+        The statement is cached, the primary key has to be provided
+        at execution in the `identifier` parameter.
+
+        :param identifier: The primary key
+        :type identifier: PRIMARY_KEY
+        :return: The DELETE statement, or None if it can't be used
+        """
+        if isinstance(identifier, (tuple, dict)) or not self._can_delete_by_pk():
+            return None
+
+        stmt = self._model_metadata.delete_query
+        if stmt is None:
+            stmt = delete(self._model).where(
+                self._model_metadata.primary_keys[0] == bindparam("identifier")
+            )
+            self._model_metadata.delete_query = stmt
+        return stmt
+
+    def _delete_many_query(self, instances: Sequence[MODEL]) -> Union[Delete, None]:
+        """Builds a single DELETE statement for many persisted models,
+        to avoid the ORM unit of work deleting them one by one, when
+        enabled by `_bulk_delete_many`.
+
+        The same models as `_delete_by_pk_query()` are supported, and all
+        the instances need to be persisted.
+
+        :param instances: The model instances
+        :type instances: Sequence[MODEL]
+        :return: The DELETE statement, or None if it can't be used
+        """
+        if not self._bulk_delete_many or not instances or not self._can_delete_by_pk():
+            return None
+
+        identities = [instance_state(x).identity for x in instances]
+        if any(identity is None for identity in identities):
+            return None
+
+        return delete(self._model).where(
+            self._model_metadata.primary_keys[0].in_(
+                [identity[0] for identity in identities]  # type: ignore
+            )
+        )
+
+    def _can_delete_by_pk(self) -> bool:
+        mapper = self._model_metadata.mapper
+        if (
+            len(mapper.primary_key) > 1
+            or len(mapper.tables) > 1
+            or mapper.version_id_col is not None
+        ):
+            return False
+
+        for r in mapper.relationships:
+            if r.cascade.delete or r.secondary is not None:
+                return False
+            # The ORM updates the foreign keys of the related rows, unless
+            # they are left to the database
+            if not r.passive_deletes and (
+                r.direction is ONETOMANY
+                or (r.direction is MANYTOONE and (r.back_populates or r.backref))
+            ):
+                return False
+        return True
 
     def _fail_if_invalid_models(self, objects: Iterable[MODEL]) -> None:
-        if [x for x in objects if not isinstance(x, self._model)]:
+        model = self._model
+        if any(type(x) is not model and not isinstance(x, model) for x in objects):
             raise InvalidModelError(
                 "Cannot handle models not belonging to this repository"
             )
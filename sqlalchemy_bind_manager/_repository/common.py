@@ -20,7 +20,7 @@
 
 from typing import Generic, List, TypeVar, Union
 
-from pydantic import BaseModel, StrictInt, StrictStr
+from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
 
 MODEL = TypeVar("MODEL")
 PRIMARY_KEY = Union[str, int, tuple, dict]
@@ -67,8 +67,25 @@ class PaginatedResult(BaseModel, Generic[MODEL]):
 
 
 class CursorReference(BaseModel):
+    """
+    A reference to a position in a cursor paginated query.
+
+    :param column: The name of the column used to order and filter the models.
+    :type column: str
+    :param value: The column value identifying the position.
+    :type value: Union[str, int]
+    :param pk_value: The primary key value identifying the position among
+        the models with the same column value. When missing, the position
+        is after (or before, when retrieving the models before the cursor)
+        all the models with the same column value.
+    :type pk_value: Union[str, int, None]
+    """
+
+    model_config = ConfigDict(frozen=True)
+
     column: str
     value: Union[StrictStr, StrictInt]
+    pk_value: Union[StrictStr, StrictInt, None] = None
 
 
 class CursorPageInfo(BaseModel):
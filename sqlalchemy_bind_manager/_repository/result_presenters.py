@@ -18,10 +18,11 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-from math import ceil
+from operator import attrgetter
 from typing import List, Union
 
 from sqlalchemy import inspect
+from sqlalchemy.orm.attributes import instance_state
 
 from .common import (
     MODEL,
@@ -76,9 +77,9 @@ class CursorPaginatedResultPresenter:
         total_items_count: int,
         items_per_page: int,
     ) -> CursorPaginatedResult:
-        return CursorPaginatedResult(
+        return CursorPaginatedResult.model_construct(
             items=[],
-            page_info=CursorPageInfo(
+            page_info=CursorPageInfo.model_construct(
                 items_per_page=items_per_page,
                 total_items=total_items_count,
             ),
@@ -94,21 +95,22 @@ class CursorPaginatedResultPresenter:
         if has_next_page:
             result_items = result_items[0:items_per_page]
         reference_column = _pk_from_result_object(result_items[0])
+        get_reference_value = attrgetter(reference_column)
 
-        return CursorPaginatedResult(
+        return CursorPaginatedResult.model_construct(
             items=result_items,
-            page_info=CursorPageInfo(
+            page_info=CursorPageInfo.model_construct(
                 items_per_page=items_per_page,
                 total_items=total_items_count,
                 has_previous_page=False,
                 has_next_page=has_next_page,
                 start_cursor=CursorReference(
                     column=reference_column,
-                    value=getattr(result_items[0], reference_column),
+                    value=get_reference_value(result_items[0]),
                 ),
                 end_cursor=CursorReference(
                     column=reference_column,
-                    value=getattr(result_items[-1], reference_column),
+                    value=get_reference_value(result_items[-1]),
                 ),
             ),
         )
@@ -122,38 +124,42 @@ class CursorPaginatedResultPresenter:
     ) -> CursorPaginatedResult:
         index = -1
         reference_column = cursor_reference.column
-        last_found_cursor_value = getattr(result_items[index], reference_column)
+        get_reference_value = attrgetter(reference_column)
+        last_found_cursor_value = get_reference_value(result_items[index])
         if not isinstance(last_found_cursor_value, type(cursor_reference.value)):
             raise TypeError(
                 "Values from CursorReference and results must be of the same type"
             )
-        has_next_page = last_found_cursor_value >= cursor_reference.value
-        if has_next_page:
-            result_items.pop(index)
-        has_previous_page = len(result_items) > items_per_page
-        if has_previous_page:
-            result_items = result_items[-items_per_page:]
+        # Values have the same type of the validated cursor reference, the new
+        # cursor references don't need to be validated again.
+        pk_attribute = _tiebreaker_from_result_object(
+            result_items[index], reference_column
+        )
+        if pk_attribute is None or cursor_reference.pk_value is None:
+            has_next_page = last_found_cursor_value >= cursor_reference.value
+        else:
+            has_next_page = (
+                last_found_cursor_value,
+                getattr(result_items[index], pk_attribute),
+            ) >= (cursor_reference.value, cursor_reference.pk_value)
+        stop = len(result_items) - 1 if has_next_page else len(result_items)
+        has_previous_page = stop > items_per_page
+        result_items = result_items[max(stop - items_per_page, 0) : stop]
 
-        return CursorPaginatedResult(
+        return CursorPaginatedResult.model_construct(
             items=result_items,
-            page_info=CursorPageInfo(
+            page_info=CursorPageInfo.model_construct(
                 items_per_page=items_per_page,
                 total_items=total_items_count,
                 has_previous_page=has_previous_page,
                 has_next_page=has_next_page,
                 start_cursor=(
-                    CursorReference(
-                        column=reference_column,
-                        value=getattr(result_items[0], reference_column),
-                    )
+                    _cursor_reference(result_items[0], reference_column, pk_attribute)
                     if result_items
                     else None
                 ),
                 end_cursor=(
-                    CursorReference(
-                        column=reference_column,
-                        value=getattr(result_items[-1], reference_column),
-                    )
+                    _cursor_reference(result_items[-1], reference_column, pk_attribute)
                     if result_items
                     else None
                 ),
@@ -169,38 +175,42 @@ class CursorPaginatedResultPresenter:
     ) -> CursorPaginatedResult:
         index = 0
         reference_column = cursor_reference.column
-        first_found_cursor_value = getattr(result_items[index], reference_column)
+        get_reference_value = attrgetter(reference_column)
+        first_found_cursor_value = get_reference_value(result_items[index])
         if not isinstance(first_found_cursor_value, type(cursor_reference.value)):
             raise TypeError(
                 "Values from CursorReference and results must be of the same type"
             )
-        has_previous_page = first_found_cursor_value <= cursor_reference.value
-        if has_previous_page:
-            result_items.pop(index)
-        has_next_page = len(result_items) > items_per_page
-        if has_next_page:
-            result_items = result_items[0:items_per_page]
+        # Values have the same type of the validated cursor reference, the new
+        # cursor references don't need to be validated again.
+        pk_attribute = _tiebreaker_from_result_object(
+            result_items[index], reference_column
+        )
+        if pk_attribute is None or cursor_reference.pk_value is None:
+            has_previous_page = first_found_cursor_value <= cursor_reference.value
+        else:
+            has_previous_page = (
+                first_found_cursor_value,
+                getattr(result_items[index], pk_attribute),
+            ) <= (cursor_reference.value, cursor_reference.pk_value)
+        start = 1 if has_previous_page else 0
+        has_next_page = len(result_items) - start > items_per_page
+        result_items = result_items[start : start + items_per_page]
 
-        return CursorPaginatedResult(
+        return CursorPaginatedResult.model_construct(
             items=result_items,
-            page_info=CursorPageInfo(
+            page_info=CursorPageInfo.model_construct(
                 items_per_page=items_per_page,
                 total_items=total_items_count,
                 has_previous_page=has_previous_page,
                 has_next_page=has_next_page,
                 start_cursor=(
-                    CursorReference(
-                        column=reference_column,
-                        value=getattr(result_items[0], reference_column),
-                    )
+                    _cursor_reference(result_items[0], reference_column, pk_attribute)
                     if result_items
                     else None
                 ),
                 end_cursor=(
-                    CursorReference(
-                        column=reference_column,
-                        value=getattr(result_items[-1], reference_column),
-                    )
+                    _cursor_reference(result_items[-1], reference_column, pk_attribute)
                     if result_items
                     else None
                 ),
@@ -219,16 +229,16 @@ class PaginatedResultPresenter:
         total_pages = (
             0
             if total_items_count == 0 or total_items_count is None
-            else ceil(total_items_count / items_per_page)
+            else -(-total_items_count // items_per_page)
         )
 
         _page = 0 if len(result_items) == 0 else min(page, total_pages)
         has_next_page = bool(_page and _page < total_pages)
         has_previous_page = bool(_page and _page > 1)
 
-        return PaginatedResult(
+        return PaginatedResult.model_construct(
             items=result_items,
-            page_info=PageInfo(
+            page_info=PageInfo.model_construct(
                 page=_page,
                 items_per_page=items_per_page,
                 total_items=total_items_count,
@@ -240,8 +250,41 @@ class PaginatedResultPresenter:
 
 
 def _pk_from_result_object(model) -> str:
-    primary_keys = inspect(type(model)).primary_key  # type: ignore
+    mapper = instance_state(model).mapper
+    primary_keys = mapper.primary_key
     if len(primary_keys) > 1:
         raise NotImplementedError("Composite primary keys are not supported.")
 
-    return primary_keys[0].name
+    # The mapped attribute name, which can differ from the column name
+    return mapper.get_property_by_column(primary_keys[0]).key
+
+
+def _tiebreaker_from_result_object(model, reference_column: str) -> Union[str, None]:
+    """Returns the primary key attribute used to order the models with
+    the same cursor column value, if needed.
+
+    :param model: A model in the results
+    :param reference_column: The name of the cursor column
+    :return: The primary key attribute name, or None if the cursor column
+        is the primary key, or the model is not mapped or has a composite
+        primary key
+    """
+    state = inspect(model, raiseerr=False)
+    if state is None or len(state.mapper.primary_key) > 1:
+        return None
+
+    mapper = state.mapper
+    pk_attribute = mapper.get_property_by_column(mapper.primary_key[0]).key
+    return None if pk_attribute == reference_column else pk_attribute
+
+
+def _cursor_reference(
+    model, reference_column: str, pk_attribute: Union[str, None]
+) -> CursorReference:
+    # Values come from the models, the cursor references don't need
+    # to be validated again.
+    return CursorReference.model_construct(
+        column=reference_column,
+        value=getattr(model, reference_column),
+        pk_value=getattr(model, pk_attribute) if pk_attribute else None,
+    )
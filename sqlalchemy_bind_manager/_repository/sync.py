@@ -18,21 +18,24 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-from contextlib import contextmanager
+from contextlib import nullcontext
 from typing import (
     Any,
+    ContextManager,
+    Dict,
     Generic,
     Iterable,
     Iterator,
     List,
     Literal,
     Mapping,
+    Sequence,
     Tuple,
     Type,
     Union,
 )
 
-from sqlalchemy import select
+from sqlalchemy import Select, insert
 from sqlalchemy.orm import Session
 
 from .._bind_manager import SQLAlchemyBind
@@ -94,12 +97,13 @@ class SQLAlchemyRepository(
         :param identifiers: A list of primary keys
         :return: A list of models
         """
-        stmt = select(self._model).where(
-            getattr(self._model, self._model_pk()).in_(identifiers)
-        )
+        stmt = self._get_many_query()
+        models: List[MODEL] = []
 
         with self._get_session(commit=False) as session:
-            return [x for x in session.execute(stmt).scalars()]
+            for params in self._get_many_params(identifiers):
+                models.extend(session.execute(stmt, params).scalars().all())
+        return models
 
     def save(self, instance: MODEL) -> MODEL:
         """Persist a model.
@@ -118,29 +122,76 @@ class SQLAlchemyRepository(
         :param instances: A list of mapped objects to be persisted
         :return: The model instances after being persisted
         """
-        self._fail_if_invalid_models(instances)
+        # The same model could be passed more than once
+        _instances = list({id(x): x for x in instances}.values())
+        self._fail_if_invalid_models(_instances)
         with self._get_session() as session:
-            session.add_all(instances)
+            params = self._bulk_insert_params(
+                _instances, session.get_bind(self._model).dialect
+            )
+            if params is not None:
+                result = session.execute(self._bulk_insert_query(), params)
+                self._populate_persisted_models(_instances, result.all())
+            session.add_all(_instances)
         return instances
 
-    def delete(self, instance: MODEL) -> None:
+    def bulk_insert(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Insert many rows in a single statement, bypassing the ORM unit of work.
+
+        ORM events (i.e. `before_insert`, `after_insert`) are not triggered
+        and no model instance is returned or tracked by the session.
+
+        :param rows: A list of mappings of column names and values
+        """
+        _rows = list(rows)
+        if not _rows:
+            return
+        with self._get_session() as session:
+            session.execute(insert(self._model), _rows)
+
+    def delete(self, entity: Union[MODEL, PRIMARY_KEY]) -> None:
         """Deletes a model.
 
-        :param instance: The model instance
+        When the primary key is passed, eligible models are deleted with
+        a single DELETE statement: ORM delete events and session
+        cascades are not triggered in this case.
+
+        :param entity: The model instance or the primary key
+        :raises ModelNotFoundError: No model has been found using the primary key
         """
-        self._fail_if_invalid_models([instance])
+        if not isinstance(entity, (str, int, tuple, dict)):
+            self._fail_if_invalid_models([entity])
+            with self._get_session() as session:
+                session.delete(entity)
+            return
+
+        stmt = self._delete_by_pk_query(entity)
         with self._get_session() as session:
-            session.delete(instance)
+            if stmt is None:
+                model = session.get(self._model, entity)
+                if model is not None:
+                    session.delete(model)
+                deleted = model is not None
+            else:
+                result = session.execute(stmt, {"identifier": entity})
+                deleted = result.rowcount > 0  # type: ignore
+        if not deleted:
+            raise ModelNotFoundError("No rows found for provided primary key.")
 
     def delete_many(self, instances: Iterable[MODEL]) -> None:
         """Deletes a collection of models in a single transaction.
 
         :param instances: The model instances
         """
-        self._fail_if_invalid_models(instances)
+        _instances = list(instances)
+        self._fail_if_invalid_models(_instances)
+        stmt = self._delete_many_query(_instances)
         with self._get_session() as session:
-            for model in instances:
-                session.delete(model)
+            if stmt is None:
+                for model in _instances:
+                    session.delete(model)
+            else:
+                session.execute(stmt)
 
     def find(
         self,
@@ -149,6 +200,7 @@ class SQLAlchemyRepository(
             None,
             Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
         ] = None,
+        eager: Union[None, Iterable[str]] = None,
     ) -> List[MODEL]:
         """Find models using filters.
 
@@ -163,15 +215,59 @@ class SQLAlchemyRepository(
             # find all models with reversed order by `name` column
             find(order_by=[("name", "desc")])
 
+            # find all models, loading the `children` relationship
+            find(eager=["children"])
+
         :param search_params: A mapping containing equality filters
         :param order_by:
+        :param eager: A list of relationships to be eager loaded
         :return: A collection of models
         """
+        stmt = self._find_query(search_params, order_by, eager)
+
+        with self._get_session(commit=False) as session:
+            result = session.execute(stmt, self._find_query_params(search_params))
+            return result.scalars().all()  # type: ignore
+
+    def find_iter(
+        self,
+        search_params: Union[None, Mapping[str, Any]] = None,
+        order_by: Union[
+            None,
+            Iterable[Union[str, Tuple[str, Literal["asc", "desc"]]]],
+        ] = None,
+    ) -> Iterator[MODEL]:
+        """Find models using filters, streaming them from the database
+        instead of loading the whole result in memory.
+
+        Models are fetched in batches of `_max_query_limit` items. The
+        eager loading of collections using `joined` or `subquery` loading
+        strategies is not supported.
+
+        Unless the repository uses an external session, models are streamed
+        using a dedicated session, kept open until the iterator is exhausted
+        or closed, so other operations can run while iterating.
+
+        E.g.
+
+            # iterate all models with name = John
+            for model in find_iter(search_params={"name":"John"}):
+                ...
+
+        :param search_params: A mapping containing equality filters
+        :param order_by:
+        :return: An iterator of models
+        """
         stmt = self._find_query(search_params, order_by)
 
-        with self._get_session() as session:
-            result = session.execute(stmt)
-            return [x for x in result.scalars()]
+        with self._get_session(commit=False, dedicated=True) as session:
+            result = session.scalars(
+                stmt,
+                self._find_query_params(search_params),
+                execution_options={"yield_per": self._max_query_limit},
+            )
+            for model in result:
+                yield model
 
     def paginated_find(
         self,
@@ -209,20 +305,37 @@ class SQLAlchemyRepository(
         :param order_by:
         :return: A collection of models
         """
+        items_per_page = self._sanitised_query_limit(items_per_page)
         find_stmt = self._find_query(search_params, order_by)
-        paginated_stmt = self._paginate_query_by_page(find_stmt, page, items_per_page)
+        params = self._find_query_params(search_params)
 
-        with self._get_session() as session:
-            total_items_count = (
-                session.execute(self._count_query(find_stmt)).scalar() or 0
-            )
-            result_items = [x for x in session.execute(paginated_stmt).scalars()]
+        with self._get_session(commit=False) as session:
+            total_items_count: Union[int, None] = None
+            result_items: Sequence[MODEL]
+            if self._counted_pagination:
+                total_items_count, result_items = self._counted_page_items(
+                    session.execute(
+                        self._counted_paginated_query(find_stmt, page, items_per_page),
+                        params,
+                    ).all()
+                )
+            else:
+                result_items = (
+                    session.execute(
+                        self._paginate_query_by_page(find_stmt, page, items_per_page),
+                        params,
+                    )
+                    .scalars()
+                    .all()
+                )
+            if total_items_count is None:
+                total_items_count = self._total_items_count(session, find_stmt, params)
 
             return PaginatedResultPresenter.build_result(
-                result_items=result_items,
+                result_items=result_items,  # type: ignore
                 total_items_count=total_items_count,
                 page=page,
-                items_per_page=self._sanitised_query_limit(items_per_page),
+                items_per_page=items_per_page,
             )
 
     def cursor_paginated_find(
@@ -257,7 +370,9 @@ class SQLAlchemyRepository(
         :param search_params: A mapping containing equality filters
         :return: A collection of models
         """
+        items_per_page = self._sanitised_query_limit(items_per_page)
         find_stmt = self._find_query(search_params)
+        params = self._find_query_params(search_params)
 
         paginated_stmt = self._cursor_paginated_query(
             find_stmt,
@@ -266,24 +381,37 @@ class SQLAlchemyRepository(
             items_per_page=items_per_page,
         )
 
-        with self._get_session() as session:
-            total_items_count = (
-                session.execute(self._count_query(find_stmt)).scalar() or 0
-            )
-            result_items = [x for x in session.execute(paginated_stmt).scalars()]
+        with self._get_session(commit=False) as session:
+            total_items_count = self._total_items_count(session, find_stmt, params)
+            result_items = session.execute(paginated_stmt, params).scalars().all()
 
             return CursorPaginatedResultPresenter.build_result(
-                result_items=result_items,
+                result_items=self._cursor_paginated_items(
+                    result_items, is_before_cursor
+                ),
                 total_items_count=total_items_count,
-                items_per_page=self._sanitised_query_limit(items_per_page),
+                items_per_page=items_per_page,
                 cursor_reference=cursor_reference,
                 is_before_cursor=is_before_cursor,
             )
 
-    @contextmanager
-    def _get_session(self, commit: bool = True) -> Iterator[Session]:
+    def _total_items_count(
+        self, session: Session, find_stmt: Select, params: Dict[str, Any]
+    ) -> int:
+        cache_key = self._count_cache_key(session, find_stmt, params)
+        total_items_count = self._cached_count(cache_key)
+        if total_items_count is None:
+            total_items_count = (
+                session.execute(self._count_query(find_stmt), params).scalar() or 0
+            )
+            self._cache_count(cache_key, total_items_count)
+        return total_items_count
+
+    def _get_session(
+        self, commit: bool = True, dedicated: bool = False
+    ) -> ContextManager[Session]:
         if not self._external_session:
-            with self._session_handler.get_session(not commit) as _session:
-                yield _session
-        else:
-            yield self._external_session
+            if dedicated:
+                return self._session_handler.get_dedicated_session()
+            return self._session_handler.get_session(not commit)
+        return nullcontext(self._external_session)
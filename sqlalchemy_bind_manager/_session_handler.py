@@ -59,6 +59,20 @@ class SessionHandler:
         finally:
             session.close()
 
+    @contextmanager
+    def get_dedicated_session(self) -> Iterator[Session]:
+        """Yields a read only session not registered in the scoped session,
+        for operations that can't share the session of the current thread.
+
+        :return: A new session, closed on exit.
+        """
+        session = self.scoped_session.session_factory()
+        try:
+            session.begin()
+            yield session
+        finally:
+            session.close()
+
     def commit(self, session: Session) -> None:
         """Commits the session and handles rollback on errors.
 
@@ -119,6 +133,20 @@ class AsyncSessionHandler:
         finally:
             await session.close()
 
+    @asynccontextmanager
+    async def get_dedicated_session(self) -> AsyncIterator[AsyncSession]:
+        """Yields a read only session not registered in the scoped session,
+        for operations that can't share the session of the current task.
+
+        :return: A new session, closed on exit.
+        """
+        session = self.scoped_session.session_factory()
+        try:
+            await session.begin()
+            yield session
+        finally:
+            await session.close()
+
     async def commit(self, session: AsyncSession) -> None:
         """Commits the session and handles rollback on errors.
 
@@ -70,7 +70,8 @@ class UnmappedPropertyError(Exception):
     """
     Raised when trying to execute queries using not mapped column names.
     (i.e. passing a non-existing column to `search_params`
-    or `order_by` parameters when invoking `find()`)
+    or `order_by` parameters, or a non-existing relationship
+    to the `eager` parameter when invoking `find()`)
     """
 
     pass
@@ -8,8 +8,8 @@ from sqlalchemy_bind_manager._repository.result_presenters import _pk_from_resul
 def test_exception_raised_if_multiple_primary_keys():
     with (
         patch(
-            "sqlalchemy_bind_manager._repository.result_presenters.inspect",
-            return_value=Mock(primary_key=["1", "2"]),
+            "sqlalchemy_bind_manager._repository.result_presenters.instance_state",
+            return_value=Mock(mapper=Mock(primary_key=["1", "2"])),
         ),
         pytest.raises(NotImplementedError),
     ):
@@ -24,3 +24,52 @@ def test_fails_if_reference_cursor_wrong_type(is_before_cursor):
             cursor_reference=CursorReference(column="model_id", value="1"),
             is_before_cursor=is_before_cursor,
         )
+
+
+@pytest.mark.parametrize(
+    ["is_before_cursor", "cursor_value", "expected_ids"],
+    [
+        (False, 0, list(range(1, 1001))),
+        (True, 1002, list(range(2, 1002))),
+    ],
+)
+def test_large_pages_are_sliced_without_changing_results(
+    is_before_cursor, cursor_value, expected_ids
+):
+    result_items = [MyModel(model_id=i, name="test") for i in range(0, 1003)]
+
+    result = CursorPaginatedResultPresenter.build_result(
+        result_items=result_items,
+        total_items_count=len(result_items),
+        items_per_page=1000,
+        cursor_reference=CursorReference(column="model_id", value=cursor_value),
+        is_before_cursor=is_before_cursor,
+    )
+
+    assert [x.model_id for x in result.items] == expected_ids
+    assert result.page_info.has_previous_page is True
+    assert result.page_info.has_next_page is True
+    assert len(result_items) == 1003
+
+
+@pytest.mark.parametrize(
+    "cursor_reference", [None, CursorReference(column="model_id", value=1)]
+)
+def test_empty_result_page_info_has_defaults(cursor_reference):
+    result = CursorPaginatedResultPresenter.build_result(
+        result_items=[],
+        total_items_count=10,
+        items_per_page=5,
+        cursor_reference=cursor_reference,
+        is_before_cursor=False,
+    )
+
+    assert result.items == []
+    assert result.page_info.model_dump() == {
+        "items_per_page": 5,
+        "total_items": 10,
+        "has_next_page": False,
+        "has_previous_page": False,
+        "start_cursor": None,
+        "end_cursor": None,
+    }
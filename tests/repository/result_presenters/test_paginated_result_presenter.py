@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+import pytest
+
+from sqlalchemy_bind_manager._repository.result_presenters import (
+    PaginatedResultPresenter,
+)
+
+
+@dataclass
+class MyModel:
+    model_id: int
+    name: str
+
+
+def test_result_items_are_not_copied():
+    result_items = [MyModel(model_id=i, name="test") for i in range(0, 3)]
+
+    result = PaginatedResultPresenter.build_result(
+        result_items=result_items,
+        total_items_count=10,
+        page=2,
+        items_per_page=3,
+    )
+
+    assert result.items is result_items
+    assert result.model_dump()["page_info"] == {
+        "page": 2,
+        "items_per_page": 3,
+        "total_pages": 4,
+        "total_items": 10,
+        "has_next_page": True,
+        "has_previous_page": True,
+    }
+
+
+@pytest.mark.parametrize(
+    ["total_items_count", "expected_total_pages"],
+    [(0, 0), (1, 1), (3, 1), (4, 2), (6, 2), (7, 3), (10**18 + 1, 10**18 // 3 + 1)],
+)
+def test_total_pages(total_items_count, expected_total_pages):
+    result = PaginatedResultPresenter.build_result(
+        result_items=[MyModel(model_id=1, name="test")],
+        total_items_count=total_items_count,
+        page=1,
+        items_per_page=3,
+    )
+
+    assert result.page_info.total_pages == expected_total_pages
@@ -1,3 +1,6 @@
+import pytest
+from pydantic import ValidationError
+
 from sqlalchemy_bind_manager.repository import CursorReference
 
 
@@ -7,3 +10,23 @@ def test_cursor_reference_doesnt_coerce_values():
         value=10,
     )
     assert isinstance(r.value, int)
+
+
+def test_cursor_reference_is_immutable():
+    r = CursorReference(
+        column="column_name",
+        value=10,
+    )
+    with pytest.raises(ValidationError):
+        r.value = 20
+    assert r == CursorReference(column="column_name", value=10)
+    assert hash(r) == hash(CursorReference(column="column_name", value=10))
+
+
+@pytest.mark.parametrize("value", [10.5, b"10", None])
+def test_cursor_reference_accepts_only_strings_and_integers(value):
+    with pytest.raises(ValidationError):
+        CursorReference(
+            column="column_name",
+            value=value,
+        )
@@ -54,3 +54,14 @@ def test_cannot_use_models_with_composite_pk(repository_class, sa_manager):
     repo = repository_class(sa_manager.get_bind())
     with pytest.raises(NotImplementedError):
         repo._model_pk()
+
+
+def test_can_delete_by_composite_pk(
+    repository_class, model_class_composite_pk, sa_manager
+):
+    repo = repository_class(sa_manager.get_bind())
+    repo.save(model_class_composite_pk(model_id=1, model_other_id=2, name="Someone"))
+
+    repo.delete((1, 2))
+
+    assert repo.find() == []
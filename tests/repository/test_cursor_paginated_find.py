@@ -1,7 +1,8 @@
 import pytest
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Integer, String
 
 from sqlalchemy_bind_manager._bind_manager import SQLAlchemyBind
+from sqlalchemy_bind_manager.exceptions import UnmappedPropertyError
 from sqlalchemy_bind_manager.repository import CursorReference
 
 
@@ -312,3 +313,163 @@ async def test_paginated_find_string_pk(
         assert result.items[k].model_id == v
     assert result.page_info.has_next_page == has_next_page
     assert result.page_info.has_previous_page == has_previous_page
+
+
+async def test_paginated_find_filtered_with_cursor(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(repo.save_many(_test_models(model_class)))
+
+    result = await sync_async_wrapper(
+        repo.cursor_paginated_find(
+            cursor_reference=CursorReference(column="model_id", value=80),
+            items_per_page=2,
+            search_params={"name": "NoOne"},
+        )
+    )
+
+    assert [x.model_id for x in result.items] == [110]
+    assert result.page_info.total_items == 1
+    assert result.page_info.has_previous_page is False
+    assert result.page_info.has_next_page is False
+
+
+async def test_paginated_find_fails_if_invalid_cursor_column(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    with pytest.raises(UnmappedPropertyError):
+        await sync_async_wrapper(
+            repo.cursor_paginated_find(
+                items_per_page=2,
+                cursor_reference=CursorReference(column="unexisting", value=1),
+            )
+        )
+
+
+@pytest.mark.parametrize("is_before_cursor", [True, False])
+async def test_paginated_find_query_is_reused_across_cursor_values(
+    repository_class, model_class, sa_bind, is_before_cursor
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    statements = [
+        repo._cursor_paginated_query(
+            repo._find_query(),
+            cursor_reference=CursorReference(column="model_id", value=value),
+            is_before_cursor=is_before_cursor,
+            items_per_page=2,
+        )
+        for value in (80, 110)
+    ]
+
+    cache_keys = [stmt._generate_cache_key() for stmt in statements]
+    assert cache_keys[0].key == cache_keys[1].key
+    assert ":cursor_value" in str(statements[0])
+
+
+@pytest.mark.parametrize("is_before_cursor", [True, False])
+async def test_paginated_find_selects_the_model_entity(
+    repository_class, model_class, sa_bind, is_before_cursor
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    stmt = repo._cursor_paginated_query(
+        repo._find_query(),
+        cursor_reference=CursorReference(column="model_id", value=110),
+        is_before_cursor=is_before_cursor,
+        items_per_page=2,
+    )
+
+    assert stmt.column_descriptions[0]["entity"] is model_class
+    assert str(stmt).count("ORDER BY") == 1
+
+
+async def test_paginated_find_with_pk_attribute_named_differently(
+    repository_class, sa_bind, sync_async_wrapper
+):
+    class RenamedPkModel(sa_bind.declarative_base):
+        __tablename__ = "renamed_pk_model"
+
+        identifier = Column("model_id", Integer, primary_key=True)
+        name = Column(String)
+
+    if isinstance(sa_bind, SQLAlchemyBind):
+        sa_bind.registry_mapper.metadata.create_all(sa_bind.engine)
+    else:
+        async with sa_bind.engine.begin() as conn:
+            await conn.run_sync(sa_bind.registry_mapper.metadata.create_all)
+
+    repo = repository_class(bind=sa_bind, model_class=RenamedPkModel)
+    await sync_async_wrapper(
+        repo.save_many([RenamedPkModel(identifier=i) for i in range(1, 4)])
+    )
+
+    result = await sync_async_wrapper(repo.cursor_paginated_find(2))
+    assert result.page_info.end_cursor == CursorReference(column="identifier", value=2)
+
+    result = await sync_async_wrapper(
+        repo.cursor_paginated_find(2, result.page_info.end_cursor)
+    )
+    assert [x.identifier for x in result.items] == [3]
+
+
+async def test_paginated_find_orders_same_column_values_by_primary_key(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    names = ["A", "B", "B", "B", "B", "C", "C"]
+    await sync_async_wrapper(
+        repo.save_many(
+            [model_class(model_id=i, name=name) for i, name in enumerate(names, 1)]
+        )
+    )
+
+    pages = []
+    result = await sync_async_wrapper(
+        repo.cursor_paginated_find(
+            2, cursor_reference=CursorReference(column="name", value="0")
+        )
+    )
+    pages.append([x.model_id for x in result.items])
+    while result.page_info.has_next_page:
+        result = await sync_async_wrapper(
+            repo.cursor_paginated_find(2, result.page_info.end_cursor)
+        )
+        pages.append([x.model_id for x in result.items])
+        assert result.page_info.has_previous_page is True
+    assert pages == [[1, 2], [3, 4], [5, 6], [7]]
+    assert result.page_info.end_cursor == CursorReference(
+        column="name", value="C", pk_value=7
+    )
+
+    pages = []
+    while result.page_info.has_previous_page:
+        result = await sync_async_wrapper(
+            repo.cursor_paginated_find(
+                2, result.page_info.start_cursor, is_before_cursor=True
+            )
+        )
+        pages.append([x.model_id for x in result.items])
+    assert pages == [[5, 6], [3, 4], [1, 2]]
+
+    # Without a primary key, the cursor is after (or before) the models
+    # with the same column value
+    result = await sync_async_wrapper(
+        repo.cursor_paginated_find(
+            10, cursor_reference=CursorReference(column="name", value="B")
+        )
+    )
+    assert [x.model_id for x in result.items] == [6, 7]
+    assert result.page_info.has_previous_page is True
+    result = await sync_async_wrapper(
+        repo.cursor_paginated_find(
+            10,
+            cursor_reference=CursorReference(column="name", value="B"),
+            is_before_cursor=True,
+        )
+    )
+    assert [x.model_id for x in result.items] == [1]
+    assert result.page_info.has_next_page is True
@@ -1,4 +1,19 @@
+from typing import ClassVar
+
 import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy.orm import relationship
+
+from sqlalchemy_bind_manager._bind_manager import SQLAlchemyBind
+from sqlalchemy_bind_manager.exceptions import ModelNotFoundError
+
+
+async def _create_tables(sa_bind):
+    if isinstance(sa_bind, SQLAlchemyBind):
+        sa_bind.registry_mapper.metadata.create_all(sa_bind.engine)
+    else:
+        async with sa_bind.engine.begin() as conn:
+            await conn.run_sync(sa_bind.registry_mapper.metadata.create_all)
 
 
 async def test_can_delete_by_instance(
@@ -33,7 +48,7 @@ async def test_delete_inexistent_raises_exception(
     results = [x for x in await sync_async_wrapper(repo.find())]
     assert len(results) == 0
 
-    with pytest.raises(Exception):
+    with pytest.raises(ModelNotFoundError):
         await sync_async_wrapper(repo.delete(4))
 
     with pytest.raises(Exception):
@@ -73,3 +88,112 @@ async def test_relationships_are_respected(
     assert len(await sync_async_wrapper(children_repo.find())) == 0
     children_retrieve_using_repo = await sync_async_wrapper(children_repo.find())
     assert len(children_retrieve_using_repo) == 0
+
+
+async def test_can_delete_by_primary_key(
+    repository_class, model_classes, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    children_repo = repository_class(bind=sa_bind, model_class=model_classes[1])
+
+    parent = model_classes[0](name="A Parent")
+    parent.children.append(model_classes[1](name="A Child"))
+    parent.children.append(model_classes[1](name="Another Child"))
+    await sync_async_wrapper(repo.save(parent))
+
+    await sync_async_wrapper(children_repo.delete(parent.children[0].model_id))
+    children = await sync_async_wrapper(children_repo.find())
+    assert [x.name for x in children] == ["Another Child"]
+
+    with pytest.raises(ModelNotFoundError):
+        await sync_async_wrapper(children_repo.delete(parent.children[0].model_id))
+
+    # Deleting the parent model needs the ORM to cascade to the children
+    await sync_async_wrapper(repo.delete(parent.model_id))
+    assert await sync_async_wrapper(repo.find()) == []
+    assert await sync_async_wrapper(children_repo.find()) == []
+
+    with pytest.raises(ModelNotFoundError):
+        await sync_async_wrapper(repo.delete(parent.model_id))
+
+
+async def test_delete_by_primary_key_uses_a_single_statement(
+    repository_class, sa_bind, sync_async_wrapper
+):
+    class StandaloneModel(sa_bind.declarative_base):
+        __tablename__ = "standalone_model"
+
+        model_id = Column(Integer, primary_key=True)
+        name = Column(String)
+
+    await _create_tables(sa_bind)
+    repo = repository_class(bind=sa_bind, model_class=StandaloneModel)
+
+    stmt = repo._delete_by_pk_query(1)
+    assert stmt is not None
+    assert repo._delete_by_pk_query(2) is stmt
+    assert repo._delete_by_pk_query((1,)) is None
+
+    await sync_async_wrapper(
+        repo.save_many([StandaloneModel(model_id=1), StandaloneModel(model_id=2)])
+    )
+    await sync_async_wrapper(repo.delete(1))
+    assert [x.model_id for x in await sync_async_wrapper(repo.find())] == [2]
+
+    with pytest.raises(ModelNotFoundError):
+        await sync_async_wrapper(repo.delete(1))
+
+
+async def test_delete_by_primary_key_is_skipped_for_versioned_models(
+    repository_class, sa_bind
+):
+    class VersionedModel(sa_bind.declarative_base):
+        __tablename__ = "versioned_model"
+
+        model_id = Column(Integer, primary_key=True)
+        version = Column(Integer, nullable=False)
+
+        __mapper_args__: ClassVar = {"version_id_col": version}
+
+    repo = repository_class(bind=sa_bind, model_class=VersionedModel)
+
+    assert repo._delete_by_pk_query(1) is None
+
+
+async def test_delete_by_primary_key_updates_non_cascading_relationships(
+    repository_class, sa_bind, sync_async_wrapper
+):
+    class LooseParentModel(sa_bind.declarative_base):
+        __tablename__ = "loose_parent_model"
+
+        model_id = Column(Integer, primary_key=True)
+        name = Column(String)
+
+        children = relationship("LooseChildModel", lazy="selectin")
+
+    class LooseChildModel(sa_bind.declarative_base):
+        __tablename__ = "loose_child_model"
+
+        model_id = Column(Integer, primary_key=True)
+        parent_model_id = Column(
+            Integer, ForeignKey("loose_parent_model.model_id"), nullable=True
+        )
+        name = Column(String)
+
+    await _create_tables(sa_bind)
+    repo = repository_class(bind=sa_bind, model_class=LooseParentModel)
+    children_repo = repository_class(bind=sa_bind, model_class=LooseChildModel)
+
+    parent = LooseParentModel(name="A Parent")
+    parent.children.append(LooseChildModel(name="A Child"))
+    await sync_async_wrapper(repo.save(parent))
+
+    # The ORM has to set the children foreign key to NULL
+    assert repo._delete_by_pk_query(parent.model_id) is None
+    # A many-to-one relationship without backref doesn't affect other rows
+    assert children_repo._delete_by_pk_query(1) is not None
+
+    await sync_async_wrapper(repo.delete(parent.model_id))
+
+    children = await sync_async_wrapper(children_repo.find())
+    assert [(x.name, x.parent_model_id) for x in children] == [("A Child", None)]
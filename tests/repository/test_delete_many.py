@@ -1,4 +1,7 @@
 import pytest
+from sqlalchemy import Column, Integer, String
+
+from sqlalchemy_bind_manager._bind_manager import SQLAlchemyBind
 
 
 async def test_can_delete_by_instance(
@@ -72,3 +75,48 @@ async def test_relationships_are_respected(
     assert len(await sync_async_wrapper(children_repo.find())) == 0
     children_retrieve_using_repo = await sync_async_wrapper(children_repo.find())
     assert len(children_retrieve_using_repo) == 0
+
+
+async def test_delete_many_uses_a_single_statement(
+    repository_class, model_classes, sa_bind, sync_async_wrapper
+):
+    class StandaloneModel(sa_bind.declarative_base):
+        __tablename__ = "standalone_model"
+
+        model_id = Column(Integer, primary_key=True)
+        name = Column(String)
+
+    if isinstance(sa_bind, SQLAlchemyBind):
+        sa_bind.registry_mapper.metadata.create_all(sa_bind.engine)
+    else:
+        async with sa_bind.engine.begin() as conn:
+            await conn.run_sync(sa_bind.registry_mapper.metadata.create_all)
+
+    class BulkDeleteRepository(repository_class):
+        _bulk_delete_many = True
+
+    repo = BulkDeleteRepository(bind=sa_bind, model_class=StandaloneModel)
+    await sync_async_wrapper(
+        repo.save_many(
+            [
+                StandaloneModel(model_id=1, name="A"),
+                StandaloneModel(model_id=2, name="B"),
+                StandaloneModel(model_id=3, name="C"),
+            ]
+        )
+    )
+    models = await sync_async_wrapper(repo.find(order_by=["name"]))
+
+    assert "IN" in str(repo._delete_many_query(models[:2]))
+    # The single statement is opt-in
+    default_repo = repository_class(bind=sa_bind, model_class=StandaloneModel)
+    assert default_repo._delete_many_query(models[:2]) is None
+    # Parent models need the ORM to cascade to the children
+    parent_repo = BulkDeleteRepository(bind=sa_bind, model_class=model_classes[0])
+    assert not parent_repo._can_delete_by_pk()
+    # Models not persisted yet are not supported
+    assert repo._delete_many_query([StandaloneModel()]) is None
+    assert repo._delete_many_query([]) is None
+
+    await sync_async_wrapper(repo.delete_many(iter(models[:2])))
+    assert [x.name for x in await sync_async_wrapper(repo.find())] == ["C"]
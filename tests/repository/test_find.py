@@ -1,5 +1,12 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from sqlalchemy_bind_manager._bind_manager import SQLAlchemyAsyncBind
 from sqlalchemy_bind_manager.exceptions import UnmappedPropertyError
 
 
@@ -39,6 +46,26 @@ async def test_find_filtered(
     assert len(results) == 1
 
 
+async def test_find_filtered_by_multiple_columns(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.save_many(
+            [
+                model_class(model_id=1, name="Someone"),
+                model_class(model_id=2, name="Someone"),
+                model_class(model_id=3, name="SomeoneElse"),
+            ]
+        )
+    )
+
+    results = await sync_async_wrapper(
+        repo.find(search_params={"name": "Someone", "model_id": 2})
+    )
+    assert [x.model_id for x in results] == [2]
+
+
 async def test_find_filtered_fails_if_invalid_filter(
     repository_class, model_class, sa_bind, sync_async_wrapper
 ):
@@ -70,6 +97,26 @@ async def test_find_ordered(repository_class, model_class, sa_bind, sync_async_w
     assert results3[0].name == "Costello"
 
 
+async def test_find_ordered_by_multiple_columns(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.save_many(
+            [
+                model_class(model_id=1, name="Abbott"),
+                model_class(model_id=2, name="Costello"),
+                model_class(model_id=3, name="Abbott"),
+            ]
+        )
+    )
+
+    results = await sync_async_wrapper(
+        repo.find(order_by=("name", ("model_id", "desc")))
+    )
+    assert [x.model_id for x in results] == [3, 1, 2]
+
+
 async def test_find_ordered_fails_if_invalid_column(
     repository_class, model_class, sa_bind, sync_async_wrapper
 ):
@@ -78,3 +125,166 @@ async def test_find_ordered_fails_if_invalid_column(
         await repo.find(order_by=("unexisting",))
     with pytest.raises(UnmappedPropertyError):
         await repo.find(order_by=(("unexisting", "desc"),))
+
+
+async def _collect(iterator):
+    if hasattr(iterator, "__aiter__"):
+        return [x async for x in iterator]
+    return list(iterator)
+
+
+async def test_find_iter(repository_class, model_class, sa_bind, sync_async_wrapper):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    repo._max_query_limit = 2
+    await sync_async_wrapper(
+        repo.save_many([model_class(name=f"Someone {i}") for i in range(5)])
+    )
+
+    results = await _collect(repo.find_iter(order_by=("name",)))
+    assert [x.name for x in results] == [f"Someone {i}" for i in range(5)]
+
+    filtered = await _collect(repo.find_iter(search_params={"name": "Someone 3"}))
+    assert [x.name for x in filtered] == ["Someone 3"]
+
+
+async def test_find_iter_uses_a_dedicated_session(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    repo._max_query_limit = 2
+    await sync_async_wrapper(
+        repo.save_many([model_class(name=f"Someone {i}") for i in range(5)])
+    )
+
+    is_async = isinstance(sa_bind, SQLAlchemyAsyncBind)
+    iterator = repo.find_iter(order_by=("name",))
+    first = await iterator.__anext__() if is_async else next(iterator)
+    # The repository session is not in use while iterating
+    assert (await sync_async_wrapper(repo.get(first.model_id))).name == "Someone 0"
+    await sync_async_wrapper(repo.save(model_class(name="Someone 5")))
+
+    with patch.object(
+        AsyncSession if is_async else Session,
+        "close",
+        new_callable=AsyncMock if is_async else MagicMock,
+    ) as mocked_close:
+        # An abandoned iterator closes its session
+        if is_async:
+            await iterator.aclose()
+        else:
+            iterator.close()
+    mocked_close.assert_called_once()
+
+
+async def test_find_eager_loads_relationships(
+    repository_class, model_classes, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    children_repo = repository_class(bind=sa_bind, model_class=model_classes[1])
+    parent = model_classes[0](name="A Parent")
+    parent.children.append(model_classes[1](name="A Child"))
+    await sync_async_wrapper(repo.save(parent))
+
+    results = await sync_async_wrapper(repo.find(eager=["children"]))
+    assert [x.name for x in results[0].children] == ["A Child"]
+
+    children = await sync_async_wrapper(children_repo.find(eager=["parent"]))
+    assert children[0].parent.name == "A Parent"
+
+
+async def test_find_eager_loading_strategy(repository_class, model_classes, sa_bind):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    children_repo = repository_class(bind=sa_bind, model_class=model_classes[1])
+
+    # Collections are loaded in a separate query, many-to-one using a join
+    assert "JOIN" not in str(repo._find_query(eager=["children"]))
+    assert "LEFT OUTER JOIN" in str(children_repo._find_query(eager=["parent"]))
+
+
+@pytest.mark.parametrize("eager", [["name"], ["unexisting"]])
+async def test_find_fails_if_invalid_eager_relationship(
+    repository_class, model_classes, sa_bind, sync_async_wrapper, eager
+):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    with pytest.raises(UnmappedPropertyError):
+        await sync_async_wrapper(repo.find(eager=eager))
+
+
+async def test_find_query_is_reused(repository_class, model_class, sa_bind):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    stmt = repo._find_query({"name": "Someone"}, iter([("name", "desc")]))
+    assert repo._find_query({"name": "SomeoneElse"}, [["name", "desc"]]) is stmt
+    assert repo._find_query({"name": None}, [("name", "desc")]) is not stmt
+    assert repo._find_query(order_by=["name"]) is repo._find_query(order_by=("name",))
+    assert repo._find_query({}) is repo._find_query()
+    assert repo._find_query({"name": "Someone", "model_id": 1}) is repo._find_query(
+        {"model_id": 2, "name": "SomeoneElse"}
+    )
+
+
+async def test_find_query_is_compiled_once(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    engine = getattr(sa_bind.engine, "sync_engine", sa_bind.engine)
+    cache_hits = []
+
+    def _before_cursor_execute(conn, cursor, statement, params, context, many):
+        cache_hits.append(context.cache_hit == CACHE_HIT)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        await sync_async_wrapper(repo.find({"name": "Someone"}, ["name"]))
+        await sync_async_wrapper(repo.find({"name": "SomeoneElse"}, ["name"]))
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+    assert cache_hits[-1] is True
+
+
+async def test_find_query_cache_is_bounded(repository_class, model_class, sa_bind):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    with patch(
+        "sqlalchemy_bind_manager._repository.base_repository._FIND_QUERIES_CACHE_SIZE",
+        2,
+    ):
+        stmt = repo._find_query(order_by=["name"])
+        repo._find_query(order_by=["model_id"])
+        repo._find_query(order_by=[("name", "desc")])
+
+        assert len(repo._model_metadata.find_queries) == 2
+        assert repo._find_query(order_by=["name"]) is not stmt
+
+
+async def test_find_filtered_by_null_value(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.save_many([model_class(name="Someone"), model_class(name=None)])
+    )
+
+    results = await sync_async_wrapper(repo.find(search_params={"name": None}))
+    assert len(results) == 1
+    assert results[0].name is None
+
+
+async def test_read_operations_do_not_commit(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    session_class = (
+        AsyncSession if isinstance(sa_bind, SQLAlchemyAsyncBind) else Session
+    )
+    session_mock = AsyncMock if isinstance(sa_bind, SQLAlchemyAsyncBind) else MagicMock
+
+    with patch.object(
+        session_class, "commit", new_callable=session_mock
+    ) as mocked_commit:
+        await sync_async_wrapper(repo.find())
+        await sync_async_wrapper(repo.paginated_find(10))
+        await sync_async_wrapper(repo.cursor_paginated_find(10))
+
+    mocked_commit.assert_not_called()
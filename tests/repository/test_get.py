@@ -1,4 +1,11 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from sqlalchemy import Column, Enum, Integer, Numeric, String, inspect
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from sqlalchemy_bind_manager._bind_manager import SQLAlchemyBind
+from sqlalchemy_bind_manager.exceptions import ModelNotFoundError
 
 
 async def test_get_returns_model(
@@ -56,6 +63,48 @@ async def test_get_many_returns_empty_list_if_nothing_found(
     assert len(result) == 0
 
 
+async def test_get_many_reuses_query(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    model = model_class(
+        model_id=1,
+        name="Someone",
+    )
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(repo.save(model))
+
+    assert await sync_async_wrapper(repo.get_many([])) == []
+    result = await sync_async_wrapper(repo.get_many(iter([1, 2])))
+    assert [m.model_id for m in result] == [1]
+    assert repo._get_many_query() is repo._get_many_query()
+    assert (
+        repository_class(bind=sa_bind, model_class=model_class)._get_many_query()
+        is repo._get_many_query()
+    )
+
+
+async def test_get_many_splits_identifiers_in_chunks(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.save_many([model_class(model_id=i, name="Someone") for i in range(1, 6)])
+    )
+
+    with patch(
+        "sqlalchemy_bind_manager._repository.base_repository._GET_MANY_CHUNK_SIZE",
+        2,
+    ):
+        assert repo._get_many_params([]) == []
+        assert repo._get_many_params(iter([1, 2, 3])) == [
+            {"identifiers": [1, 2]},
+            {"identifiers": [3]},
+        ]
+        result = await sync_async_wrapper(repo.get_many(range(1, 7)))
+
+    assert sorted(x.model_id for x in result) == [1, 2, 3, 4, 5]
+
+
 async def test_get_raises_exception_if_not_found(
     repository_class, model_class, sa_bind, sync_async_wrapper
 ):
@@ -63,3 +112,157 @@ async def test_get_raises_exception_if_not_found(
 
     with pytest.raises(Exception):
         await sync_async_wrapper(repo.get(3))
+
+
+class _FastReadMixin:
+    _fast_read = True
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_fast_get_statement_is_built_once(repository_class, model_class, sa_bind):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    dialect = asyncpg.dialect()
+
+    statement = repo._fast_get_statement(dialect, 1)
+    assert statement == (
+        "SELECT parent_model.model_id, parent_model.name \n"
+        "FROM parent_model \n"
+        "WHERE parent_model.model_id = $1::INTEGER"
+    )
+    assert repo._fast_get_statement(dialect, 2) is statement
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_fast_get_statement_is_skipped_when_not_eligible(
+    repository_class, model_class, sa_bind
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    assert repo._fast_get_statement(asyncpg.dialect(), (1,)) is None
+    assert repo._fast_get_statement(sa_bind.engine.dialect, 1) is None
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+@pytest.mark.parametrize("row", [(1, "Someone"), None])
+async def test_fast_get_uses_driver_connection(
+    repository_class, model_class, sa_bind, row
+):
+    raw_connection = MagicMock()
+    raw_connection.driver_connection.fetchrow = AsyncMock(return_value=row)
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    model = await repo._fast_get(session, "SQL", 1)
+
+    raw_connection.driver_connection.fetchrow.assert_awaited_once_with("SQL", 1)
+    if row is None:
+        assert model is None
+    else:
+        assert isinstance(model, model_class)
+        assert (model.model_id, model.name) == row
+        assert inspect(model).detached
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_get_uses_fast_read_when_eligible(repository_class, model_class, sa_bind):
+    class FastReadRepository(_FastReadMixin, repository_class):
+        pass
+
+    repo = FastReadRepository(bind=sa_bind, model_class=model_class)
+    with (
+        patch.object(repo, "_fast_get_statement", return_value="SQL"),
+        patch.object(
+            repo, "_fast_get", new_callable=AsyncMock, return_value=None
+        ) as mocked_fast_get,
+        pytest.raises(ModelNotFoundError),
+    ):
+        await repo.get(1)
+
+    mocked_fast_get.assert_awaited_once()
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_get_uses_the_orm_with_external_session(
+    repository_class, model_class, sa_bind
+):
+    class FastReadRepository(_FastReadMixin, repository_class):
+        pass
+
+    await repository_class(bind=sa_bind, model_class=model_class).save(
+        model_class(model_id=1, name="Someone")
+    )
+
+    async with sa_bind.session_class() as session, session.begin():
+        repo = FastReadRepository(session=session, model_class=model_class)
+        with (
+            patch.object(repo, "_fast_get_statement", return_value="SQL"),
+            patch.object(repo, "_fast_get", new_callable=AsyncMock) as mocked_fast_get,
+        ):
+            model = await repo.get(1)
+
+        # The model is attached to the external session, as with session.get
+        assert model in session
+        mocked_fast_get.assert_not_awaited()
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_fast_get_statement_is_skipped_for_processed_columns(
+    repository_class, sa_bind
+):
+    class ProcessedColumnsModel(sa_bind.declarative_base):
+        __tablename__ = "processed_columns_model"
+
+        model_id = Column(Integer, primary_key=True)
+        status = Column(Enum("active", "inactive"))
+
+    class NumericModel(sa_bind.declarative_base):
+        __tablename__ = "numeric_model"
+
+        model_id = Column(Integer, primary_key=True)
+        amount = Column(Numeric(asdecimal=False))
+
+    for model in (ProcessedColumnsModel, NumericModel):
+        repo = repository_class(bind=sa_bind, model_class=model)
+        assert repo._fast_get_statement(asyncpg.dialect(), 1) is None
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_get_falls_back_when_fast_read_is_not_supported(
+    repository_class, model_class, sa_bind
+):
+    class FastReadRepository(_FastReadMixin, repository_class):
+        pass
+
+    repo = FastReadRepository(bind=sa_bind, model_class=model_class)
+    await repo.save(model_class(model_id=1, name="Someone"))
+
+    assert (await repo.get(1)).name == "Someone"
+
+
+async def test_get_many_with_pk_attribute_named_differently(
+    repository_class, sa_bind, sync_async_wrapper
+):
+    class RenamedPkModel(sa_bind.declarative_base):
+        __tablename__ = "renamed_pk_model"
+
+        identifier = Column("model_id", Integer, primary_key=True)
+        name = Column(String)
+
+    if isinstance(sa_bind, SQLAlchemyBind):
+        sa_bind.registry_mapper.metadata.create_all(sa_bind.engine)
+    else:
+        async with sa_bind.engine.begin() as conn:
+            await conn.run_sync(sa_bind.registry_mapper.metadata.create_all)
+
+    repo = repository_class(bind=sa_bind, model_class=RenamedPkModel)
+    await sync_async_wrapper(
+        repo.save_many(
+            [RenamedPkModel(identifier=1, name="A"), RenamedPkModel(identifier=2)]
+        )
+    )
+
+    result = await sync_async_wrapper(repo.get_many([1]))
+    assert [x.identifier for x in result] == [1]
@@ -0,0 +1,166 @@
+from typing import ClassVar
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy.exc import MissingGreenlet
+from sqlalchemy.orm import relationship
+
+from sqlalchemy_bind_manager._repository import async_
+from sqlalchemy_bind_manager.repository import (
+    AsyncUnitOfWork,
+    SQLAlchemyAsyncRepository,
+)
+
+
+@pytest.fixture
+async def lazy_model_classes(sa_manager):
+    sa_bind = sa_manager.get_bind("async")
+
+    class LazyParentModel(sa_bind.declarative_base):
+        __tablename__ = "lazy_parent_model"
+        __mapper_args__: ClassVar = {"eager_defaults": True}
+
+        model_id = Column(Integer, primary_key=True, autoincrement=True)
+        name = Column(String)
+
+        children = relationship("LazyChildModel", cascade="all, delete-orphan")
+
+    class LazyChildModel(sa_bind.declarative_base):
+        __tablename__ = "lazy_child_model"
+        __mapper_args__: ClassVar = {"eager_defaults": True}
+
+        model_id = Column(Integer, primary_key=True, autoincrement=True)
+        parent_model_id = Column(
+            Integer, ForeignKey("lazy_parent_model.model_id"), nullable=False
+        )
+        name = Column(String)
+
+    async with sa_bind.engine.begin() as conn:
+        await conn.run_sync(sa_bind.registry_mapper.metadata.create_all)
+
+    return sa_bind, LazyParentModel, LazyChildModel
+
+
+@pytest.fixture
+def lazy_load_warnings():
+    SQLAlchemyAsyncRepository.enable_lazy_load_warnings()
+    yield
+    SQLAlchemyAsyncRepository.disable_lazy_load_warnings()
+
+
+async def test_lazy_load_emits_warning(lazy_model_classes, lazy_load_warnings):
+    sa_bind, parent_class, child_class = lazy_model_classes
+    repo = SQLAlchemyAsyncRepository(bind=sa_bind, model_class=parent_class)
+    await repo.save(parent_class(model_id=1, children=[child_class(name="A Child")]))
+
+    uow = AsyncUnitOfWork(sa_bind)
+    uow.register_repository("parent", SQLAlchemyAsyncRepository, parent_class)
+    async with uow.transaction(read_only=True):
+        parent = await uow.repository("parent").get(1)
+        with pytest.warns(
+            UserWarning,
+            match=(
+                "Lazy load on LazyParentModel.children from SQLAlchemyAsyncRepository"
+            ),
+        ) as warnings_info:
+            with pytest.raises(MissingGreenlet):
+                parent.children
+
+    # The warning points to the code accessing the attribute
+    assert warnings_info[0].filename == __file__
+
+
+async def test_lazy_load_warnings_are_not_emitted_by_other_sessions(
+    lazy_model_classes, lazy_load_warnings, recwarn
+):
+    sa_bind, parent_class, child_class = lazy_model_classes
+    repo = SQLAlchemyAsyncRepository(bind=sa_bind, model_class=parent_class)
+    await repo.save(parent_class(model_id=1, children=[child_class(name="A Child")]))
+
+    async with sa_bind.session_class() as session, session.begin():
+        parent = await session.get(parent_class, 1)
+        with pytest.raises(MissingGreenlet):
+            parent.children
+
+    assert not [w for w in recwarn if "Lazy load" in str(w.message)]
+
+
+async def test_lazy_load_warnings_only_for_repository_models(
+    lazy_model_classes, lazy_load_warnings, recwarn
+):
+    sa_bind, parent_class, child_class = lazy_model_classes
+    repo = SQLAlchemyAsyncRepository(bind=sa_bind, model_class=parent_class)
+    await repo.save(parent_class(model_id=1, children=[child_class(name="A Child")]))
+
+    uow = AsyncUnitOfWork(sa_bind)
+    uow.register_repository("child", SQLAlchemyAsyncRepository, child_class)
+    async with uow.transaction(read_only=True):
+        await uow.repository("child").find()
+        session = uow.repository("child")._external_session
+        parent = await session.get(parent_class, 1)
+        with pytest.raises(MissingGreenlet):
+            parent.children
+
+    assert not [w for w in recwarn if "Lazy load" in str(w.message)]
+
+
+async def test_lazy_load_hook_is_registered_once_per_session(
+    lazy_model_classes, lazy_load_warnings, recwarn
+):
+    sa_bind, parent_class, child_class = lazy_model_classes
+    repo = SQLAlchemyAsyncRepository(bind=sa_bind, model_class=parent_class)
+    await repo.save(parent_class(model_id=1, children=[child_class(name="A Child")]))
+
+    uow = AsyncUnitOfWork(sa_bind)
+    uow.register_repository("parent", SQLAlchemyAsyncRepository, parent_class)
+    SQLAlchemyAsyncRepository.enable_lazy_load_warnings()
+    async with uow.transaction(read_only=True):
+        await uow.repository("parent").find()
+        parent = await uow.repository("parent").get(1)
+        with pytest.raises(MissingGreenlet):
+            parent.children
+
+    assert len([w for w in recwarn if "Lazy load" in str(w.message)]) == 1
+
+
+async def test_disabled_lazy_load_warnings(lazy_model_classes, recwarn):
+    sa_bind, parent_class, child_class = lazy_model_classes
+    repo = SQLAlchemyAsyncRepository(bind=sa_bind, model_class=parent_class)
+    await repo.save(parent_class(model_id=1, children=[child_class(name="A Child")]))
+
+    uow = AsyncUnitOfWork(sa_bind)
+    uow.register_repository("parent", SQLAlchemyAsyncRepository, parent_class)
+    async with uow.transaction(read_only=True):
+        parent = await uow.repository("parent").get(1)
+        with pytest.raises(MissingGreenlet):
+            parent.children
+
+    assert not [w for w in recwarn if "Lazy load" in str(w.message)]
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_eager_loads_do_not_emit_warnings(
+    model_classes, sa_bind, lazy_load_warnings, recwarn
+):
+    repo = SQLAlchemyAsyncRepository(bind=sa_bind, model_class=model_classes[0])
+    parent = model_classes[0](name="A Parent", children=[model_classes[1]()])
+    await repo.save(parent)
+    await repo.get(parent.model_id)
+
+    assert not [w for w in recwarn if "Lazy load" in str(w.message)]
+
+
+@pytest.mark.parametrize(
+    ["env_value", "enabled"],
+    [
+        ("1", True),
+        ("0", False),
+    ],
+)
+def test_lazy_load_warnings_enabled_from_env(monkeypatch, env_value, enabled):
+    monkeypatch.setenv(async_.LAZY_LOAD_WARNINGS_ENV_VAR, env_value)
+    try:
+        async_._enable_lazy_load_warnings_from_env()
+        assert SQLAlchemyAsyncRepository._lazy_load_warnings is enabled
+    finally:
+        SQLAlchemyAsyncRepository.disable_lazy_load_warnings()
@@ -21,3 +21,20 @@ async def test_fails_when_saving_models_not_belonging_to_repository(
 
     with pytest.raises(InvalidModelError):
         await sync_async_wrapper(repo.delete_many([invalid_model]))
+
+
+async def test_fails_when_any_model_does_not_belong_to_repository(
+    repository_class, model_classes, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+
+    models = [
+        model_classes[0](name="A Parent"),
+        model_classes[0](name="Another Parent"),
+        model_classes[1](name="A Child"),
+    ]
+
+    with pytest.raises(InvalidModelError):
+        await sync_async_wrapper(repo.save_many(models))
+
+    assert await sync_async_wrapper(repo.find()) == []
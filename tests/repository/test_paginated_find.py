@@ -1,3 +1,10 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session, with_loader_criteria
+
+
 async def test_paginated_find_page_length(
     repository_class, model_class, sa_bind, sync_async_wrapper
 ):
@@ -57,6 +64,38 @@ async def test_paginated_find_max_page_length_is_respected(
     assert results.page_info.has_previous_page is False
 
 
+async def test_paginated_find_max_page_length_is_respected_on_next_pages(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    repo._max_query_limit = 2
+    await sync_async_wrapper(
+        repo.save_many([model_class(model_id=i, name=f"Someone {i}") for i in range(5)])
+    )
+
+    results = await sync_async_wrapper(
+        repo.paginated_find(page=2, items_per_page=50, order_by=["model_id"])
+    )
+    assert [x.model_id for x in results.items] == [2, 3]
+    assert results.page_info.page == 2
+    assert results.page_info.items_per_page == 2
+    assert results.page_info.total_pages == 3
+    assert results.page_info.has_next_page is True
+    assert results.page_info.has_previous_page is True
+
+
+@pytest.mark.parametrize(
+    ["items_per_page", "expected_limit"],
+    [(-1, 0), (0, 0), (1, 1), (50, 50), (51, 50)],
+)
+async def test_query_limit_is_sanitised(
+    repository_class, model_class, sa_bind, items_per_page, expected_limit
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    assert repo._sanitised_query_limit(items_per_page) == expected_limit
+
+
 async def test_paginated_find_last_page(
     repository_class, model_class, sa_bind, sync_async_wrapper
 ):
@@ -138,3 +177,279 @@ async def test_paginated_find_no_result_filters(
     assert results.page_info.total_items == 0
     assert results.page_info.has_next_page is False
     assert results.page_info.has_previous_page is False
+
+
+async def test_paginated_find_counted_in_page_query(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    class CountedRepository(repository_class):
+        _counted_pagination = True
+
+    repo = CountedRepository(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.save_many([model_class(name=f"Someone {i}") for i in range(5)])
+    )
+
+    results = await sync_async_wrapper(
+        repo.paginated_find(page=2, items_per_page=2, order_by=["name"])
+    )
+    assert [x.name for x in results.items] == ["Someone 2", "Someone 3"]
+    assert results.page_info.total_items == 5
+    assert results.page_info.total_pages == 3
+
+    with patch.object(repo, "_count_query", wraps=repo._count_query) as count_query:
+        await sync_async_wrapper(repo.paginated_find(page=1, items_per_page=2))
+        count_query.assert_not_called()
+
+        results = await sync_async_wrapper(
+            repo.paginated_find(page=4, items_per_page=2)
+        )
+        count_query.assert_called_once()
+    assert results.items == []
+    assert results.page_info.total_items == 5
+
+
+async def test_paginated_find_deferred_join(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    class DeferredJoinRepository(repository_class):
+        _deferred_join_pagination = True
+
+    repo = DeferredJoinRepository(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.save_many([model_class(name=f"Someone {i}") for i in range(5)])
+    )
+
+    results = await sync_async_wrapper(
+        repo.paginated_find(
+            page=2,
+            items_per_page=2,
+            search_params={"name": "Someone 4"},
+        )
+    )
+    assert results.items == []
+    assert results.page_info.total_items == 1
+
+    results = await sync_async_wrapper(
+        repo.paginated_find(page=2, items_per_page=2, order_by=[("name", "desc")])
+    )
+    assert [x.name for x in results.items] == ["Someone 2", "Someone 1"]
+    assert results.page_info.total_items == 5
+    assert "page_keys" in str(
+        repo._paginate_query_by_page(repo._find_query(), page=2, items_per_page=2)
+    )
+    assert "page_keys" not in str(
+        repo._paginate_query_by_page(repo._find_query(), page=1, items_per_page=2)
+    )
+
+
+async def test_paginated_find_deferred_join_not_used_for_distinct_queries(
+    repository_class, model_class, sa_bind
+):
+    class DeferredJoinRepository(repository_class):
+        _deferred_join_pagination = True
+
+    repo = DeferredJoinRepository(bind=sa_bind, model_class=model_class)
+
+    distinct_stmt = repo._find_query().distinct()
+    paginated_stmt = repo._paginate_query_by_page(
+        distinct_stmt, page=2, items_per_page=2
+    )
+    assert "page_keys" not in str(paginated_stmt)
+    assert "OFFSET" in str(paginated_stmt)
+
+
+async def test_count_query_does_not_use_subquery_for_filters(
+    repository_class, model_class, sa_bind
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    count_stmt = repo._count_query(
+        repo._find_query(search_params={"name": "Someone"}, order_by=["name"])
+    )
+    assert str(count_stmt).split() == [
+        "SELECT",
+        "count(*)",
+        "AS",
+        "count_1",
+        "FROM",
+        "parent_model",
+        "WHERE",
+        "parent_model.name",
+        "=",
+        ":search_name",
+    ]
+    assert "WHERE" not in str(repo._count_query(repo._find_query()))
+
+
+async def test_count_query_is_reused(repository_class, model_class, sa_bind):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    find_stmt = repo._find_query(search_params={"name": "Someone"})
+
+    count_stmt = repo._count_query(find_stmt)
+    assert repo._count_query(find_stmt) is count_stmt
+    assert repo._count_query(repo._find_query()) is not count_stmt
+
+    with patch(
+        "sqlalchemy_bind_manager._repository.base_repository._FIND_QUERIES_CACHE_SIZE",
+        2,
+    ):
+        repo._count_query(repo._find_query(order_by=["name"]))
+        assert len(repo._model_metadata.count_queries) == 2
+        assert repo._count_query(find_stmt) is not count_stmt
+
+
+async def test_count_query_uses_subquery_for_distinct_queries(
+    repository_class, model_class, sa_bind
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    distinct_stmt = repo._find_query().with_only_columns(model_class.name).distinct()
+    assert "anon_1" in str(repo._count_query(distinct_stmt))
+
+
+async def test_count_query_drops_ordering_unless_limited(
+    repository_class, model_class, sa_bind
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    ordered_stmt = (
+        repo._find_query(order_by=["name"])
+        .with_only_columns(model_class.name)
+        .distinct()
+    )
+    assert "ORDER BY" not in str(repo._count_query(ordered_stmt))
+    assert "ORDER BY" in str(repo._count_query(ordered_stmt.limit(2)))
+
+
+async def test_count_query_subquery_selects_a_single_column(
+    repository_class, model_classes, sa_bind
+):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[1])
+
+    count_stmt = str(repo._count_query(repo._find_query(eager=["parent"]).limit(2)))
+    assert "JOIN" not in count_stmt
+    assert count_stmt.split("FROM (SELECT ")[1].startswith("child_model.")
+    assert "," not in count_stmt.split("FROM (SELECT ")[1].split("FROM")[0]
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_paginated_find_concurrent_queries(
+    repository_class, model_class, sa_bind
+):
+    class ConcurrentRepository(repository_class):
+        _concurrent_pagination = True
+
+    repo = ConcurrentRepository(bind=sa_bind, model_class=model_class)
+    await repo.save_many([model_class(name=f"Someone {i}") for i in range(3)])
+
+    results = await repo.paginated_find(2, search_params={"name": "Someone 1"})
+    assert [x.name for x in results.items] == ["Someone 1"]
+    assert results.page_info.total_items == 1
+
+    cursor_results = await repo.cursor_paginated_find(2)
+    assert len(cursor_results.items) == 2
+    assert cursor_results.page_info.total_items == 3
+    assert cursor_results.page_info.has_next_page is True
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_paginated_find_concurrent_queries_do_not_leak_sessions(
+    repository_class, model_class, sa_bind
+):
+    class ConcurrentRepository(repository_class):
+        _concurrent_pagination = True
+
+    repo = ConcurrentRepository(bind=sa_bind, model_class=model_class)
+    await repo.save(model_class(name="Someone"))
+    registry = repo._session_handler.scoped_session.registry.registry
+    registry_size = len(registry)
+
+    for _ in range(3):
+        await repo.paginated_find(2)
+
+    assert len(registry) == registry_size
+
+
+async def test_paginated_find_caches_count(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    class CachedCountRepository(repository_class):
+        _count_cache_ttl = 60
+
+    repo = CachedCountRepository(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(repo.save(model_class(name="Someone")))
+
+    results = await sync_async_wrapper(
+        repo.paginated_find(2, search_params={"name": "Someone"})
+    )
+    assert results.page_info.total_items == 1
+
+    await sync_async_wrapper(repo.save(model_class(name="Someone")))
+
+    # The cached count is used until it expires
+    results = await sync_async_wrapper(
+        repo.paginated_find(2, search_params={"name": "Someone"})
+    )
+    assert len(results.items) == 2
+    assert results.page_info.total_items == 1
+    cursor_results = await sync_async_wrapper(
+        repo.cursor_paginated_find(2, search_params={"name": "Someone"})
+    )
+    assert cursor_results.page_info.total_items == 1
+    results = await sync_async_wrapper(repo.paginated_find(2))
+    assert results.page_info.total_items == 2
+
+    with patch(
+        "sqlalchemy_bind_manager._repository.base_repository.monotonic",
+        return_value=float("inf"),
+    ):
+        results = await sync_async_wrapper(
+            repo.paginated_find(2, search_params={"name": "Someone"})
+        )
+    assert results.page_info.total_items == 2
+
+
+async def test_count_cache_is_bounded(repository_class, model_class, sa_bind):
+    class CachedCountRepository(repository_class):
+        _count_cache_ttl = 60
+
+    repo = CachedCountRepository(bind=sa_bind, model_class=model_class)
+    session = MagicMock()
+    stmt = repo._find_query()
+
+    assert repo._count_cache_key(session, stmt, {"search_name": []}) is None
+    with patch(
+        "sqlalchemy_bind_manager._repository.base_repository._COUNT_CACHE_SIZE",
+        1,
+    ):
+        repo._cache_count(repo._count_cache_key(session, stmt, {}), 1)
+        key = repo._count_cache_key(session, stmt, {"search_name": "Someone"})
+        repo._cache_count(key, 2)
+
+    assert len(repo._model_metadata.counts) == 1
+    assert repo._cached_count(key) == 2
+
+
+async def test_paginated_find_count_applies_orm_criteria(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    def _hide_deleted(orm_execute_state):
+        if orm_execute_state.is_select:
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                with_loader_criteria(model_class, model_class.name != "Deleted")
+            )
+
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.save_many([model_class(name="Someone"), model_class(name="Deleted")])
+    )
+
+    event.listen(Session, "do_orm_execute", _hide_deleted)
+    try:
+        results = await sync_async_wrapper(repo.paginated_find(10))
+    finally:
+        event.remove(Session, "do_orm_execute", _hide_deleted)
+
+    assert [x.name for x in results.items] == ["Someone"]
+    assert results.page_info.total_items == 1
@@ -47,3 +47,15 @@ def test_repository_initialise_with_valid_model(model_class, repository_class, s
 
     ExtendedModel(bind=sa_bind)
     repository_class(bind=sa_bind, model_class=model_class)
+
+
+def test_repositories_share_model_metadata(repository_class, model_classes, sa_bind):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    other_repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    children_repo = repository_class(bind=sa_bind, model_class=model_classes[1])
+
+    assert repo._model_metadata is other_repo._model_metadata
+    assert repo._model_metadata is not children_repo._model_metadata
+    assert repo._find_query(order_by=["name"]) is other_repo._find_query(
+        order_by=["name"]
+    )
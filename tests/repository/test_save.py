@@ -1,7 +1,21 @@
+from typing import ClassVar
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    Column,
+    Computed,
+    Enum,
+    FetchedValue,
+    Identity,
+    Integer,
+    String,
+    event,
+    inspect,
+    text,
+)
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from sqlalchemy.orm import Session
 
 from sqlalchemy_bind_manager._bind_manager import SQLAlchemyAsyncBind
@@ -152,3 +166,402 @@ async def test_nested_models_are_deleted(
 
     retrieved_parent2 = await sync_async_wrapper(repo.get(parent.model_id))
     assert len(retrieved_parent2.children) == 1
+
+
+async def test_bulk_insert(repository_class, model_class, sa_bind, sync_async_wrapper):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(
+        repo.bulk_insert(
+            [
+                {"model_id": 1, "name": "Someone"},
+                {"model_id": 2, "name": "SomeoneElse"},
+            ]
+        )
+    )
+
+    results = await sync_async_wrapper(repo.find(order_by=["model_id"]))
+    assert [(x.model_id, x.name) for x in results] == [
+        (1, "Someone"),
+        (2, "SomeoneElse"),
+    ]
+
+
+async def test_bulk_insert_without_rows_does_nothing(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    await sync_async_wrapper(repo.bulk_insert(iter([])))
+
+    assert await sync_async_wrapper(repo.find()) == []
+
+
+async def test_save_many_new_models_can_be_updated(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    models = [model_class(name="Someone"), model_class(name="SomeoneElse")]
+    await sync_async_wrapper(repo.save_many(models))
+    assert models[0].model_id is not None
+    assert models[1].model_id is not None
+    assert models[0].name == "Someone"
+
+    models[0].name = "Mario"
+    await sync_async_wrapper(repo.save_many(models))
+
+    results = await sync_async_wrapper(repo.find(order_by=["model_id"]))
+    assert [x.name for x in results] == ["Mario", "SomeoneElse"]
+
+
+async def test_save_many_persists_nested_models(
+    repository_class, model_classes, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    children_repo = repository_class(bind=sa_bind, model_class=model_classes[1])
+    parents = [
+        model_classes[0](name="A Parent", children=[model_classes[1]()]),
+        model_classes[0](name="Another Parent", children=[model_classes[1]()]),
+    ]
+    await sync_async_wrapper(repo.save_many(parents))
+
+    assert len(await sync_async_wrapper(children_repo.find())) == 2
+
+
+async def test_save_many_triggers_insert_events(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    inserted = []
+
+    def _before_insert(mapper, connection, target):
+        inserted.append(target.name)
+
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    event.listen(model_class, "before_insert", _before_insert)
+    try:
+        await sync_async_wrapper(
+            repo.save_many([model_class(name="Someone"), model_class(name="Else")])
+        )
+    finally:
+        event.remove(model_class, "before_insert", _before_insert)
+
+    assert sorted(inserted) == ["Else", "Someone"]
+
+
+class _BulkSaveMixin:
+    _bulk_save_many = True
+
+
+async def test_bulk_save_many_uses_a_single_statement(
+    repository_class, model_class, sa_bind, sync_async_wrapper
+):
+    class BulkSaveRepository(_BulkSaveMixin, repository_class):
+        pass
+
+    repo = BulkSaveRepository(bind=sa_bind, model_class=model_class)
+    dialect = sa_bind.engine.dialect
+    models = [model_class(name="Someone"), model_class(name="SomeoneElse")]
+
+    assert repo._bulk_insert_params(models, dialect) is not None
+    # The single statement is opt-in
+    default_repo = repository_class(bind=sa_bind, model_class=model_class)
+    assert default_repo._bulk_insert_params(models, dialect) is None
+
+    # The same model passed twice is persisted once
+    await sync_async_wrapper(repo.save_many([models[0], models[0], models[1]]))
+    assert all(m.model_id is not None for m in models)
+    results = await sync_async_wrapper(repo.find(order_by=["model_id"]))
+    assert [x.name for x in results] == ["Someone", "SomeoneElse"]
+
+
+async def test_bulk_save_many_is_skipped_with_insert_listeners(
+    repository_class, model_class, sa_bind
+):
+    class BulkSaveRepository(_BulkSaveMixin, repository_class):
+        pass
+
+    def _after_insert(mapper, connection, target):
+        pass
+
+    repo = BulkSaveRepository(bind=sa_bind, model_class=model_class)
+    event.listen(model_class, "after_insert", _after_insert)
+    try:
+        assert (
+            repo._bulk_insert_params(
+                [model_class(), model_class()], sa_bind.engine.dialect
+            )
+            is None
+        )
+    finally:
+        event.remove(model_class, "after_insert", _after_insert)
+
+
+async def test_bulk_insert_params_requires_returning_support(
+    repository_class, model_class, sa_bind
+):
+    class BulkSaveRepository(_BulkSaveMixin, repository_class):
+        pass
+
+    repo = BulkSaveRepository(bind=sa_bind, model_class=model_class)
+    dialect = MagicMock(insert_executemany_returning_sort_by_parameter_order=False)
+
+    assert repo._bulk_insert_params([model_class(), model_class()], dialect) is None
+
+
+async def test_bulk_insert_params_skips_versioned_models(repository_class, sa_bind):
+    class VersionedModel(sa_bind.declarative_base):
+        __tablename__ = "versioned_model"
+
+        model_id = Column(Integer, primary_key=True, autoincrement=True)
+        version_id = Column(Integer, nullable=False)
+        name = Column(String)
+
+        __mapper_args__: ClassVar = {"version_id_col": version_id}
+
+    class BulkSaveRepository(_BulkSaveMixin, repository_class):
+        pass
+
+    repo = BulkSaveRepository(bind=sa_bind, model_class=VersionedModel)
+    dialect = MagicMock(insert_executemany_returning_sort_by_parameter_order=True)
+
+    assert (
+        repo._bulk_insert_params([VersionedModel(), VersionedModel()], dialect) is None
+    )
+
+
+async def test_new_models_params_requires_same_populated_columns(
+    repository_class, model_class, sa_bind
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+
+    assert repo._new_models_params([model_class(name="Someone"), model_class()]) is None
+
+
+async def test_new_models_params_requires_new_models(
+    repository_class, model_classes, sa_bind, sync_async_wrapper
+):
+    repo = repository_class(bind=sa_bind, model_class=model_classes[0])
+    model = model_classes[0](name="Someone")
+    await sync_async_wrapper(repo.save(model))
+
+    assert repo._new_models_params([model]) is None
+    assert (
+        repo._new_models_params([model_classes[0](children=[model_classes[1]()])])
+        is None
+    )
+
+
+@pytest.fixture
+def postgresql_copy_mocks():
+    raw_connection = MagicMock()
+    raw_connection.driver_connection.copy_records_to_table = AsyncMock()
+    connection = MagicMock()
+    connection.exec_driver_sql = AsyncMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw_connection)
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=connection)
+
+    return session, asyncpg.dialect(), raw_connection.driver_connection
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_copy_models_uses_asyncpg_copy(
+    repository_class, model_class, sa_bind, postgresql_copy_mocks
+):
+    session, dialect, driver_connection = postgresql_copy_mocks
+
+    class CopyRepository(repository_class):
+        _copy_threshold = 2
+
+    repo = CopyRepository(bind=sa_bind, model_class=model_class)
+    models = [
+        model_class(model_id=1, name="Someone"),
+        model_class(model_id=2, name="SomeoneElse"),
+    ]
+
+    assert await repo._copy_models(session, models, dialect) is True
+    driver_connection.copy_records_to_table.assert_awaited_once_with(
+        "parent_model",
+        records=[(1, "Someone"), (2, "SomeoneElse")],
+        columns=["model_id", "name"],
+        schema_name=None,
+    )
+    assert all(inspect(m).detached for m in models)
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+@pytest.mark.parametrize(
+    ["copy_threshold", "with_pk", "dialect_name"],
+    [
+        (None, True, "postgresql"),
+        (3, True, "postgresql"),
+        (2, False, "postgresql"),
+        (2, True, "sqlite"),
+    ],
+)
+async def test_copy_models_is_skipped_when_not_eligible(
+    repository_class,
+    model_class,
+    sa_bind,
+    postgresql_copy_mocks,
+    copy_threshold,
+    with_pk,
+    dialect_name,
+):
+    session, dialect, driver_connection = postgresql_copy_mocks
+    if dialect_name == "sqlite":
+        dialect = sa_bind.engine.dialect
+
+    class CopyRepository(repository_class):
+        _copy_threshold = copy_threshold
+
+    repo = CopyRepository(bind=sa_bind, model_class=model_class)
+    models = [
+        model_class(name="Someone", **({"model_id": 1} if with_pk else {})),
+        model_class(name="SomeoneElse", **({"model_id": 2} if with_pk else {})),
+    ]
+
+    assert await repo._copy_models(session, models, dialect) is False
+    driver_connection.copy_records_to_table.assert_not_awaited()
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_copy_models_runs_in_the_session_transaction(
+    repository_class, model_class, sa_bind
+):
+    class CopyRepository(repository_class):
+        _copy_threshold = 2
+
+    repo = CopyRepository(bind=sa_bind, model_class=model_class)
+    statements = []
+    copied_after = []
+    driver_connection = MagicMock()
+    driver_connection.copy_records_to_table = AsyncMock(
+        side_effect=lambda *args, **kwargs: copied_after.extend(statements)
+    )
+    models = [
+        model_class(model_id=1, name="Someone"),
+        model_class(model_id=2, name="SomeoneElse"),
+    ]
+
+    def _record_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    # Only the driver connection is replaced, the SQLAlchemy session is real
+    event.listen(sa_bind.engine.sync_engine, "before_cursor_execute", _record_statement)
+    try:
+        async with sa_bind.session_class() as session, session.begin():
+            with patch.object(
+                AsyncConnection,
+                "get_raw_connection",
+                new_callable=AsyncMock,
+                return_value=MagicMock(driver_connection=driver_connection),
+            ):
+                assert await repo._copy_models(session, models, asyncpg.dialect())
+    finally:
+        event.remove(
+            sa_bind.engine.sync_engine, "before_cursor_execute", _record_statement
+        )
+
+    # A statement went through the adapter, starting the transaction before COPY
+    assert copied_after == ["SELECT 1"]
+    assert all(inspect(m).detached for m in models)
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_copy_models_is_skipped_for_processed_columns(
+    repository_class, sa_bind, postgresql_copy_mocks
+):
+    session, dialect, driver_connection = postgresql_copy_mocks
+
+    class ProcessedColumnsModel(sa_bind.declarative_base):
+        __tablename__ = "processed_columns_model"
+
+        model_id = Column(Integer, primary_key=True)
+        status = Column(Enum("active", "inactive"))
+        counter = Column(Integer, default=0)
+
+    class CopyRepository(repository_class):
+        _copy_threshold = 1
+
+    repo = CopyRepository(bind=sa_bind, model_class=ProcessedColumnsModel)
+
+    # The Enum bind processor validates the values
+    assert not await repo._copy_models(
+        session, [ProcessedColumnsModel(model_id=1, status="active")], dialect
+    )
+    # The Python side default would not be applied
+    assert not await repo._copy_models(
+        session, [ProcessedColumnsModel(model_id=1)], dialect
+    )
+    driver_connection.copy_records_to_table.assert_not_awaited()
+    assert await repo._copy_models(
+        session, [ProcessedColumnsModel(model_id=1, counter=1)], dialect
+    )
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+@pytest.mark.parametrize(
+    "column",
+    [
+        Column(Integer, server_default=text("0")),
+        Column(Integer, server_onupdate=FetchedValue()),
+        Column(Integer, Computed("model_id * 2")),
+        Column(Integer, Identity()),
+    ],
+)
+async def test_copy_models_is_skipped_for_columns_generated_by_the_database(
+    repository_class, sa_bind, postgresql_copy_mocks, column
+):
+    session, dialect, driver_connection = postgresql_copy_mocks
+
+    class GeneratedColumnModel(sa_bind.declarative_base):
+        __tablename__ = "generated_column_model"
+
+        model_id = Column(Integer, primary_key=True)
+        generated = column
+
+    class CopyRepository(repository_class):
+        _copy_threshold = 1
+
+    repo = CopyRepository(bind=sa_bind, model_class=GeneratedColumnModel)
+
+    # The generated value would not be loaded in the detached model
+    assert not await repo._copy_models(
+        session, [GeneratedColumnModel(model_id=1)], dialect
+    )
+    driver_connection.copy_records_to_table.assert_not_awaited()
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_save_many_falls_back_when_copy_is_not_supported(
+    repository_class, model_class, sa_bind
+):
+    class CopyRepository(repository_class):
+        _copy_threshold = 1
+
+    repo = CopyRepository(bind=sa_bind, model_class=model_class)
+    await repo.save_many(
+        [
+            model_class(model_id=1, name="Someone"),
+            model_class(model_id=2, name="SomeoneElse"),
+        ]
+    )
+
+    assert len(await repo.find()) == 2
+
+
+@pytest.mark.parametrize("sa_bind", ["async"], indirect=True)
+async def test_save_many_uses_copy_when_supported(
+    repository_class, model_class, sa_bind
+):
+    repo = repository_class(bind=sa_bind, model_class=model_class)
+    models = [
+        model_class(model_id=1, name="Someone"),
+        model_class(model_id=2, name="SomeoneElse"),
+    ]
+
+    with patch.object(
+        repo, "_copy_models", new_callable=AsyncMock, return_value=True
+    ) as mocked_copy:
+        await repo.save_many(models)
+
+    mocked_copy.assert_awaited_once()
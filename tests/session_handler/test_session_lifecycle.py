@@ -99,6 +99,26 @@ async def test_commit_is_called_only_if_not_read_only(
     assert mocked_sh_commit.call_count == int(not read_only_flag)
 
 
+async def test_commit_is_not_called_if_operation_fails(
+    session_handler_class,
+    model_class,
+    sa_bind,
+    sync_async_cm_wrapper,
+):
+    sh = session_handler_class(sa_bind)
+
+    with patch.object(
+        session_handler_class, "commit", return_value=None
+    ) as mocked_sh_commit:
+        with pytest.raises(ValueError):
+            async with sync_async_cm_wrapper(sh.get_session()) as _session:
+                _session.add(model_class(name="Someone"))
+                raise ValueError()
+
+    assert mocked_sh_commit.call_count == 0
+    assert not _session.in_transaction()
+
+
 @pytest.mark.parametrize("commit_fails", [True, False])
 async def test_rollback_is_called_if_commit_fails(
     commit_fails,
@@ -2,6 +2,7 @@ import pytest
 from sqlalchemy import MetaData
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, registry
+from sqlalchemy.pool import QueuePool
 
 from sqlalchemy_bind_manager import (
     SQLAlchemyBindManager,
@@ -71,3 +72,39 @@ def test_multiple_binds(multiple_config):
     assert async_bind is not None
     assert isinstance(sa_manager.get_mapper("async"), registry)
     assert isinstance(sa_manager.get_session("async"), AsyncSession)
+
+
+@pytest.mark.parametrize(
+    ["engine_url", "async_engine"],
+    [
+        ("sqlite:///./lifo.db", False),
+        ("sqlite+aiosqlite:///./lifo.db", True),
+    ],
+)
+def test_queue_pool_defaults_to_lifo(engine_url, async_engine):
+    sa_manager = SQLAlchemyBindManager(
+        SQLAlchemyConfig(engine_url=engine_url, async_engine=async_engine)
+    )
+    pool = sa_manager.get_bind().engine.pool
+
+    assert pool._pre_ping is True
+    assert pool._pool.use_lifo is True
+
+
+def test_queue_pool_options_can_be_overridden():
+    sa_manager = SQLAlchemyBindManager(
+        SQLAlchemyConfig(
+            engine_url="sqlite:///./lifo.db",
+            engine_options=dict(pool_use_lifo=False, pool_pre_ping=False),
+        )
+    )
+    pool = sa_manager.get_bind().engine.pool
+
+    assert pool._pre_ping is False
+    assert pool._pool.use_lifo is False
+
+
+def test_non_queue_pool_does_not_receive_queue_options():
+    sa_manager = SQLAlchemyBindManager(SQLAlchemyConfig(engine_url="sqlite://"))
+
+    assert not isinstance(sa_manager.get_bind().engine.pool, QueuePool)